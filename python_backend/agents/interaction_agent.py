@@ -10,6 +10,11 @@ from openai import AsyncOpenAI
 
 from .tools.registry import get_tools_for_openai, TOOL_REGISTRY
 from .tools.executor import ToolExecutor
+from services.speedups import json_dumps
+
+def _dump_tool_result(result: Any) -> str:
+    """Serialize a tool result for the LLM; chart payloads carry hundreds of floats"""
+    return json_dumps(result).decode()
 
 class InteractionAgent:
     """
@@ -704,7 +709,7 @@ Remember: You're building trust. Be accurate, be helpful, and help users build w
                 "role": "tool",
                 "tool_call_id": tool_result["tool_call_id"],
                 "name": tool_result["function_name"],
-                "content": json.dumps(tool_result["result"])
+                "content": _dump_tool_result(tool_result["result"])
             })
         
         # Second LLM call - synthesize tool results into response
@@ -7,6 +7,9 @@ from typing import List, Dict, Any
 
 from .registry import get_tool_function
 
+# Exa calls share one deadline so a slow search can't hold up the whole batch
+EXA_TOOL_TIMEOUT = 15.0
+
 class ToolExecutor:
     """
     Executes tools called by the LLM.
@@ -53,8 +56,16 @@ class ToolExecutor:
             }
         
         try:
+            if function_name.startswith("exa_"):
+                return await asyncio.wait_for(tool_function(**arguments), EXA_TOOL_TIMEOUT)
             result = await tool_function(**arguments)
             return result
+        except asyncio.TimeoutError:
+            print(f"⏱️ Tool timed out ({function_name}) after {EXA_TOOL_TIMEOUT}s")
+            return {
+                "error": f"Timed out after {EXA_TOOL_TIMEOUT}s",
+                "message": f"'{function_name}' took too long to respond, so I skipped it."
+            }
         except Exception as e:
             print(f"❌ Tool execution error ({function_name}): {e}")
             return {
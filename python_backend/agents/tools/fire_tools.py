@@ -4,7 +4,7 @@ Brutal portfolio roasting, FIRE calculations, and negotiation system
 """
 
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TypedDict
 from datetime import datetime
 import random
 from dotenv import load_dotenv
@@ -19,6 +19,20 @@ from services.robinhood_client import RobinhoodClient
 # snaptrade_client = SnapTradeClient()  # Removed
 robinhood_client = RobinhoodClient()
 
+class RobinhoodPosition(TypedDict):
+    """Shape of a formatted Robinhood position returned to the agent"""
+    symbol: str
+    shares: float
+    current_price: float
+    market_value: float
+    cost_basis: float
+    unrealized_pl: float
+    unrealized_pl_percent: float
+
+def _safe_pct(numerator: float, denominator: float) -> float:
+    """Percentage of numerator over denominator, 0 when there is no base to divide by"""
+    return numerator * 100 / denominator if denominator > 0 else 0
+
 @register_tool("roast_portfolio")
 async def roast_portfolio(
     portfolio_data: Dict[str, Any] = None,
@@ -47,7 +61,7 @@ async def roast_portfolio(
         total_invested = sum(pos["shares"] * pos["avg_cost"] for pos in portfolio_data["positions"])
         total_current = sum(pos["shares"] * pos["current_price"] for pos in portfolio_data["positions"])
         total_pnl = total_current - total_invested
-        pnl_percent = (total_pnl / total_invested * 100) if total_invested else 0
+        pnl_percent = _safe_pct(total_pnl, total_invested)
         
         # Analyze holdings
         meme_stocks = ["GME", "AMC", "BB", "NOK", "DOGE", "SHIB", "APE", "BBBY", "EXPR", "NAKD"]
@@ -514,6 +528,101 @@ async def negotiate_access(
         print(f"❌ Error negotiating access: {e}")
         return {"error": str(e)}
 
+# Static parts of the risk assessment result, one entry per risk bucket
+_RISK_PROFILES = {
+    "Conservative": {
+        "recommendation_type": "Index Funds & ETFs",
+        "recommended_allocations": {
+            "bonds": 40,
+            "index_funds": 50,
+            "stocks": 10,
+            "options": 0
+        },
+        "description": "You prefer capital preservation over growth. Index funds and ETFs are perfect for you.",
+        "recommendations": [
+            "Focus on VTI (Total Stock Market) and BND (Bonds) ETFs",
+            "Consider target-date funds for set-and-forget investing",
+            "Avoid individual stocks and options completely",
+            "Rebalance quarterly to maintain allocation"
+        ]
+    },
+    "Moderate": {
+        "recommendation_type": "Balanced Portfolio",
+        "recommended_allocations": {
+            "bonds": 20,
+            "index_funds": 50,
+            "stocks": 25,
+            "options": 5
+        },
+        "description": "You can handle some volatility for better returns. A balanced approach works well.",
+        "recommendations": [
+            "Core holding: VTI + VXUS (Total World Stock Market)",
+            "Add some individual blue-chip stocks (AAPL, MSFT, GOOGL)",
+            "Consider covered calls on your stock positions",
+            "Keep emergency fund in high-yield savings"
+        ]
+    },
+    "Aggressive": {
+        "recommendation_type": "Growth-Focused",
+        "recommended_allocations": {
+            "bonds": 10,
+            "index_funds": 30,
+            "stocks": 50,
+            "options": 10
+        },
+        "description": "You're comfortable with risk for higher returns. Individual stocks and options can be part of your strategy.",
+        "recommendations": [
+            "Build concentrated positions in high-conviction stocks",
+            "Use options for income (covered calls, cash-secured puts)",
+            "Consider growth stocks and sector ETFs",
+            "Active management and regular rebalancing"
+        ]
+    }
+}
+
+def _make_risk_response_builder(risk_profile: str):
+    """Pre-render everything except the risk score for one bucket and return a builder for it"""
+    profile = _RISK_PROFILES[risk_profile]
+    allocations = profile["recommended_allocations"]
+    assessment = {
+        "risk_profile": risk_profile,
+        "recommendation_type": profile["recommendation_type"],
+        "description": profile["description"],
+        "recommended_allocations": allocations
+    }
+    response_head = f"Based on your answers, you're a **{risk_profile}** investor with a risk score of **"
+    response_tail = f"/10**.\n\n**Your Profile**: {profile['description']}\n\n**Recommended Strategy**: {profile['recommendation_type']}\n\n**Suggested Allocation**:\n• Bonds: {allocations['bonds']}%\n• Index Funds: {allocations['index_funds']}%\n• Individual Stocks: {allocations['stocks']}%\n• Options: {allocations['options']}%"
+    recommendations = profile["recommendations"]
+    
+    def build(risk_score: int) -> Dict[str, Any]:
+        return {
+            "conversation_stage": "risk_profile_complete",
+            # Fresh nested containers so callers can't mutate _RISK_PROFILES through the result
+            "risk_assessment": {
+                "risk_score": risk_score,
+                **assessment,
+                "recommended_allocations": dict(allocations)
+            },
+            "response": f"{response_head}{risk_score}{response_tail}",
+            "recommendations": list(recommendations),
+            "next_steps": "Use this risk profile for portfolio recommendations and FIRE calculations"
+        }
+    
+    return build
+
+_RISK_RESPONSE_BUILDERS = {
+    risk_profile: _make_risk_response_builder(risk_profile)
+    for risk_profile in _RISK_PROFILES
+}
+
+def _risk_bucket(risk_score: int) -> str:
+    """Map a 1-10 risk score to its profile bucket"""
+    if risk_score <= 3:
+        return "Conservative"
+    elif risk_score <= 6:
+        return "Moderate"
+    return "Aggressive"
+
 @register_tool("assess_risk_tolerance")
 async def assess_risk_tolerance(
     user_responses: Dict[str, Any] = None,
@@ -623,76 +732,7 @@ async def assess_risk_tolerance(
             # Clamp risk score to 1-10
             risk_score = max(1, min(10, risk_score))
             
-            # Determine risk profile
-            if risk_score <= 3:
-                risk_profile = "Conservative"
-                recommendation_type = "Index Funds & ETFs"
-                recommended_allocations = {
-                    "bonds": 40,
-                    "index_funds": 50,
-                    "stocks": 10,
-                    "options": 0
-                }
-                description = "You prefer capital preservation over growth. Index funds and ETFs are perfect for you."
-            elif risk_score <= 6:
-                risk_profile = "Moderate"
-                recommendation_type = "Balanced Portfolio"
-                recommended_allocations = {
-                    "bonds": 20,
-                    "index_funds": 50,
-                    "stocks": 25,
-                    "options": 5
-                }
-                description = "You can handle some volatility for better returns. A balanced approach works well."
-            else:
-                risk_profile = "Aggressive"
-                recommendation_type = "Growth-Focused"
-                recommended_allocations = {
-                    "bonds": 10,
-                    "index_funds": 30,
-                    "stocks": 50,
-                    "options": 10
-                }
-                description = "You're comfortable with risk for higher returns. Individual stocks and options can be part of your strategy."
-            
-            # Generate specific recommendations
-            recommendations = []
-            
-            if risk_score <= 3:
-                recommendations.extend([
-                    "Focus on VTI (Total Stock Market) and BND (Bonds) ETFs",
-                    "Consider target-date funds for set-and-forget investing",
-                    "Avoid individual stocks and options completely",
-                    "Rebalance quarterly to maintain allocation"
-                ])
-            elif risk_score <= 6:
-                recommendations.extend([
-                    "Core holding: VTI + VXUS (Total World Stock Market)",
-                    "Add some individual blue-chip stocks (AAPL, MSFT, GOOGL)",
-                    "Consider covered calls on your stock positions",
-                    "Keep emergency fund in high-yield savings"
-                ])
-            else:
-                recommendations.extend([
-                    "Build concentrated positions in high-conviction stocks",
-                    "Use options for income (covered calls, cash-secured puts)",
-                    "Consider growth stocks and sector ETFs",
-                    "Active management and regular rebalancing"
-                ])
-            
-            return {
-                "conversation_stage": "risk_profile_complete",
-                "risk_assessment": {
-                    "risk_score": risk_score,
-                    "risk_profile": risk_profile,
-                    "recommendation_type": recommendation_type,
-                    "description": description,
-                    "recommended_allocations": recommended_allocations
-                },
-                "response": f"Based on your answers, you're a **{risk_profile}** investor with a risk score of **{risk_score}/10**.\n\n**Your Profile**: {description}\n\n**Recommended Strategy**: {recommendation_type}\n\n**Suggested Allocation**:\n• Bonds: {recommended_allocations['bonds']}%\n• Index Funds: {recommended_allocations['index_funds']}%\n• Individual Stocks: {recommended_allocations['stocks']}%\n• Options: {recommended_allocations['options']}%",
-                "recommendations": recommendations,
-                "next_steps": "Use this risk profile for portfolio recommendations and FIRE calculations"
-            }
+            return _RISK_RESPONSE_BUILDERS[_risk_bucket(risk_score)](risk_score)
         
         else:
             return {
@@ -812,7 +852,7 @@ async def get_real_portfolio(
         total_invested = sum(pos.get("cost_basis", 0) for pos in positions)
         total_current = sum(pos.get("market_value", 0) for pos in positions)
         total_pnl = total_current - total_invested
-        pnl_percent = (total_pnl / total_invested * 100) if total_invested else 0
+        pnl_percent = _safe_pct(total_pnl, total_invested)
         
         return {
             "success": True,
@@ -867,8 +907,8 @@ async def analyze_robinhood_portfolio(
             }
         
         # Use first account if none specified
-        if not account_id:
-            account_id = accounts[0].get("account_number")
+        first_account = accounts[0]
+        account_id = account_id or first_account.get("account_number")
         
         # Get positions and portfolio data
         positions_result = await robinhood_client.get_positions(access_token, account_id)
@@ -886,14 +926,14 @@ async def analyze_robinhood_portfolio(
         total_cost_basis = 0
         
         if portfolios:
-            portfolio = portfolios[0] if isinstance(portfolios, list) else portfolios
+            portfolio = portfolios[0]  # get_portfolios always returns a list
             total_equity = float(portfolio.get("equity", 0))
             total_market_value = float(portfolio.get("market_value", 0))
             total_cost_basis = float(portfolio.get("extended_hours_equity", 0))
         
         # Calculate P&L
         total_pnl = total_equity - total_cost_basis
-        pnl_percent = (total_pnl / total_cost_basis * 100) if total_cost_basis > 0 else 0
+        pnl_percent = _safe_pct(total_pnl, total_cost_basis)
         
         # Get market data for symbols
         symbols = [pos.get("instrument", "").split("/")[-2] for pos in active_positions if pos.get("instrument")]
@@ -905,7 +945,7 @@ async def analyze_robinhood_portfolio(
                 market_data = {quote.get("symbol"): quote for quote in quotes}
         
         # Format positions with real data
-        formatted_positions = []
+        formatted_positions: List[RobinhoodPosition] = []
         for pos in active_positions:
             symbol = pos.get("instrument", "").split("/")[-2] if pos.get("instrument") else "UNKNOWN"
             quantity = float(pos.get("quantity", 0))
@@ -920,7 +960,7 @@ async def analyze_robinhood_portfolio(
             market_value = quantity * current_price
             cost_basis = quantity * avg_cost
             unrealized_pl = market_value - cost_basis
-            unrealized_pl_percent = (unrealized_pl / cost_basis * 100) if cost_basis > 0 else 0
+            unrealized_pl_percent = _safe_pct(unrealized_pl, cost_basis)
             
             formatted_positions.append({
                 "symbol": symbol,
@@ -943,7 +983,7 @@ async def analyze_robinhood_portfolio(
                 "total_cost_basis": total_cost_basis,
                 "total_pnl": total_pnl,
                 "pnl_percent": pnl_percent,
-                "cash": float(accounts[0].get("cash", 0)) if accounts else 0
+                "cash": float(first_account.get("cash", 0) or 0)
             },
             "market_data": market_data,
             "message": "Real Robinhood portfolio data fetched successfully"
@@ -4,12 +4,28 @@ SIMPLIFIED: LLM handles ticker resolution
 """
 
 import os
+import re
+import logging
+import time
+import heapq
+import bisect
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlparse
 from datetime import datetime, timedelta
 import random
+import httpx
 from dotenv import load_dotenv
 
+# NumPy is only used to vectorize large portfolio analyses
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Load environment variables first
 load_dotenv()
 
@@ -18,8 +34,32 @@ from services.financial_datasets_client import FinancialDatasetsClient
 from services.exa_client import ExaClient
 from services.chart_service import ChartService
 from services.screener_service import ScreenerService
+from services.cache import (
+    async_ttl_cache,
+    make_key,
+    TTLCache,
+    CACHE_TTL_FINANCIALS,
+    CACHE_TTL_METRICS,
+    CACHE_TTL_NEWS,
+    CACHE_TTL_INSIDER,
+    CACHE_TTL_INSTITUTIONAL,
+    CACHE_TTL_MOVERS,
+    CACHE_TTL_SOCIAL,
+    CACHE_TTL_EARNINGS,
+    CACHE_TTL_ANALYST_RATINGS,
+    CACHE_TTL_REVALIDATE,
+    CACHE_TTL_EXA_SEARCH,
+    CACHE_TTL_EXA_ANSWER,
+    CACHE_TTL_EXA_SIMILAR,
+    CACHE_TTL_EXA_CONTENTS,
+)
+# orjson-backed when installed; API responses and request bodies are large
+from services.speedups import json_loads as _json_loads, json_dumps as _json_dumps
 # SnapTrade removed - use mock portfolio for recommendations
 from agents.portfolio_debate_coordinator import PortfolioDebateCoordinator
+from agents.research_config import get_config
+
+logger = logging.getLogger(__name__)
 
 # Initialize clients (after load_dotenv)
 fd_client = FinancialDatasetsClient()
@@ -27,6 +67,83 @@ exa_client = ExaClient()
 chart_service = ChartService()
 screener_service = ScreenerService()
 # snaptrade_client removed
+# Local research API (whiteboard); one pooled client instead of a connection per save
+_save_client = httpx.AsyncClient(
+    base_url="http://localhost:8788",
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=4)
+)
+
+async def close_clients() -> None:
+    """Close the shared FDS, Exa and research-save connection pools (call on app shutdown)"""
+    await asyncio.gather(
+        fd_client.close(), exa_client.close(), _save_client.aclose(), return_exceptions=True
+    )
+
+async def warm_clients() -> None:
+    """Open keep-alive connections to FDS and Exa so the first tool call skips the TLS handshake"""
+    # Any response (even a 404) leaves a pooled connection behind
+    results = await asyncio.gather(
+        fd_client.client.head(fd_client.base_url, timeout=2.0),
+        exa_client.client.head(exa_client.base_url, timeout=2.0),
+        return_exceptions=True
+    )
+    for name, outcome in zip(("FDS", "Exa"), results):
+        if isinstance(outcome, Exception):
+            logger.info("%s warmup failed: %s", name, outcome)
+
+def _load_json(response) -> Any:
+    """Decode an httpx response body with the fastest available parser"""
+    return _json_loads(response.content)
+
+# Bound in-flight FDS requests so large fan-outs don't trip rate limits or starve the loop
+FD_CONCURRENCY = int(os.getenv("FD_CONCURRENCY", "16"))
+FD_TIMEOUT = 10.0
+_FD_SEM = asyncio.Semaphore(FD_CONCURRENCY)
+# Bound once; every FDS tool call goes through _fd_get
+_http_get = fd_client.client.get
+_FD_BASE = fd_client.base_url
+
+async def _fd_get(
+    path: str,
+    params: Dict[str, Any] = None,
+    timeout: float = FD_TIMEOUT,
+    headers: Dict[str, str] = None
+):
+    """Bounded, time-limited GET against the FinancialDatasets API"""
+    async with _FD_SEM:
+        return await _http_get(_FD_BASE + path, params=params, headers=headers, timeout=timeout)
+
+async def _bounded_quote(ticker: str) -> Dict[str, Any]:
+    async with _FD_SEM:
+        return await fd_client.get_quote(ticker)
+
+async def _fds_get(path: str, params: Dict[str, Any]) -> Optional[Any]:
+    """GET a FinancialDatasets endpoint; returns the decoded body, or None on a non-200"""
+    response = await _fd_get(path, params)
+    if response.status_code != 200:
+        return None
+    return _load_json(response)
+
+# (ETag, decoded body) of the last 200 per request, for conditional revalidation
+_etag_cache = TTLCache(max_size=1024)
+
+async def _fds_get_revalidated(path: str, params: Dict[str, Any]) -> Optional[Any]:
+    """Like _fds_get, but sends If-None-Match when we hold an ETag; a 304 reuses the stored body"""
+    cache_key = make_key((path,), params)
+    held, entry = _etag_cache.get(cache_key)
+    response = await _fd_get(path, params, headers={"If-None-Match": entry[0]} if held else None)
+    
+    if response.status_code == 304 and held:
+        return entry[1]
+    if response.status_code != 200:
+        return None
+    
+    data = _load_json(response)
+    etag = response.headers.get("ETag")
+    if etag:
+        _etag_cache.set(cache_key, (etag, data), CACHE_TTL_REVALIDATE)
+    return data
 
 @register_tool("get_stock_price")
 async def get_stock_price(
@@ -70,10 +187,11 @@ async def get_stock_price(
                 "end_date": prices[-1]["date"] if prices else None
             }
     except Exception as e:
-        print(f"❌ Error fetching stock price: {e}")
+        logger.warning("Error fetching stock price for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
 @register_tool("get_financials")
+@async_ttl_cache(ttl=CACHE_TTL_FINANCIALS)
 async def get_financials(
     ticker: str,
     period: str = "quarterly"
@@ -83,19 +201,15 @@ async def get_financials(
     """
     try:
         # Get income statement for EPS, revenue, profit margins
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/financials/income-statements/",
-            params={"ticker": ticker, "period": period, "limit": 1}
-        )
+        data = await _fds_get("/financials/income-statements/", {"ticker": ticker, "period": period, "limit": 1})
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             if data.get("income_statements"):
                 stmt = data["income_statements"][0]
                 
                 # Calculate key metrics
-                revenue = stmt.get("revenue", 0)
-                net_income = stmt.get("net_income", 0)
+                revenue = stmt.get("revenue") or 0
+                net_income = stmt.get("net_income") or 0
                 profit_margin = (net_income / revenue * 100) if revenue else 0
                 
                 return {
@@ -118,10 +232,11 @@ async def get_financials(
         return {"error": "Could not fetch financial data", "ticker": ticker}
     
     except Exception as e:
-        print(f"❌ Error fetching financials: {e}")
+        logger.warning("Error fetching financials for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
 @register_tool("get_balance_sheet")
+@async_ttl_cache(ttl=CACHE_TTL_FINANCIALS)
 async def get_balance_sheet(
     ticker: str,
     period: str = "quarterly"
@@ -130,35 +245,35 @@ async def get_balance_sheet(
     Get balance sheet data for a company.
     """
     try:
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/financials/balance-sheets/",
-            params={"ticker": ticker, "period": period, "limit": 1}
-        )
+        data = await _fds_get("/financials/balance-sheets/", {"ticker": ticker, "period": period, "limit": 1})
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             if data.get("balance_sheets"):
                 bs = data["balance_sheets"][0]
+                total_assets = bs.get("total_assets")
+                total_debt = bs.get("total_debt")
+                equity = bs.get("shareholders_equity")
                 return {
                     "ticker": ticker,
                     "report_period": bs.get("report_period"),
-                    "total_assets": bs.get("total_assets"),
-                    "total_assets_billions": bs.get("total_assets", 0) / 1e9,
+                    "total_assets": total_assets,
+                    "total_assets_billions": (total_assets or 0) / 1e9,
                     "total_liabilities": bs.get("total_liabilities"),
-                    "shareholders_equity": bs.get("shareholders_equity"),
+                    "shareholders_equity": equity,
                     "cash_and_equivalents": bs.get("cash_and_equivalents"),
-                    "total_debt": bs.get("total_debt"),
+                    "total_debt": total_debt,
                     "current_assets": bs.get("current_assets"),
                     "current_liabilities": bs.get("current_liabilities"),
-                    "debt_to_equity": bs.get("total_debt", 0) / bs.get("shareholders_equity", 1) if bs.get("shareholders_equity") else 0
+                    "debt_to_equity": (total_debt or 0) / equity if equity else 0
                 }
         
         return {"error": "Could not fetch balance sheet", "ticker": ticker}
     except Exception as e:
-        print(f"❌ Error fetching balance sheet: {e}")
+        logger.warning("Error fetching balance sheet for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
 @register_tool("get_cash_flow")
+@async_ttl_cache(ttl=CACHE_TTL_FINANCIALS)
 async def get_cash_flow(
     ticker: str,
     period: str = "quarterly"
@@ -167,32 +282,30 @@ async def get_cash_flow(
     Get cash flow statement for a company.
     """
     try:
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/financials/cash-flow-statements/",
-            params={"ticker": ticker, "period": period, "limit": 1}
-        )
+        data = await _fds_get("/financials/cash-flow-statements/", {"ticker": ticker, "period": period, "limit": 1})
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             if data.get("cash_flow_statements"):
                 cf = data["cash_flow_statements"][0]
+                free_cash_flow = cf.get("free_cash_flow")
                 return {
                     "ticker": ticker,
                     "report_period": cf.get("report_period"),
                     "operating_cash_flow": cf.get("net_cash_flow_from_operations"),
                     "investing_cash_flow": cf.get("net_cash_flow_from_investing"),
                     "financing_cash_flow": cf.get("net_cash_flow_from_financing"),
-                    "free_cash_flow": cf.get("free_cash_flow"),
-                    "free_cash_flow_billions": cf.get("free_cash_flow", 0) / 1e9,
+                    "free_cash_flow": free_cash_flow,
+                    "free_cash_flow_billions": (free_cash_flow or 0) / 1e9,
                     "capital_expenditure": cf.get("capital_expenditure")
                 }
         
         return {"error": "Could not fetch cash flow", "ticker": ticker}
     except Exception as e:
-        print(f"❌ Error fetching cash flow: {e}")
+        logger.warning("Error fetching cash flow for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
 @register_tool("get_financial_metrics")
+@async_ttl_cache(ttl=CACHE_TTL_METRICS)
 async def get_financial_metrics(
     ticker: str,
     period: str = "ttm"
@@ -201,13 +314,9 @@ async def get_financial_metrics(
     Get key financial ratios and metrics (P/E, ROE, margins, etc).
     """
     try:
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/financial-metrics/",
-            params={"ticker": ticker, "period": period, "limit": 1}
-        )
+        data = await _fds_get("/financial-metrics/", {"ticker": ticker, "period": period, "limit": 1})
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             # FDS returns metrics directly or in an array
             metrics = data if isinstance(data, dict) else data[0] if isinstance(data, list) and data else {}
             
@@ -228,10 +337,11 @@ async def get_financial_metrics(
         
         return {"error": "Could not fetch financial metrics", "ticker": ticker}
     except Exception as e:
-        print(f"❌ Error fetching financial metrics: {e}")
+        logger.warning("Error fetching financial metrics for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
 @register_tool("get_company_news")
+@async_ttl_cache(ttl=CACHE_TTL_NEWS)
 async def get_company_news(
     ticker: str,
     limit: int = 10
@@ -240,14 +350,11 @@ async def get_company_news(
     Get recent news articles about a company.
     """
     try:
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/news/",
-            params={"ticker": ticker, "limit": limit}
-        )
+        data = await _fds_get("/news/", {"ticker": ticker, "limit": limit})
         
-        if response.status_code == 200:
-            data = response.json()
-            news_items = data.get("news", [])
+        if data is not None:
+            # The server is asked for `limit` items; never project past it if it oversupplies
+            news_items = data.get("news", [])[:limit]
             
             return {
                 "ticker": ticker,
@@ -258,15 +365,16 @@ async def get_company_news(
                     "source": item.get("source"),
                     "url": item.get("url"),
                     "sentiment": item.get("sentiment")
-                } for item in news_items[:limit]]
+                } for item in news_items]
             }
         
         return {"error": "Could not fetch news", "ticker": ticker}
     except Exception as e:
-        print(f"❌ Error fetching news: {e}")
+        logger.warning("Error fetching news for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
 @register_tool("get_insider_trades")
+@async_ttl_cache(ttl=CACHE_TTL_INSIDER)
 async def get_insider_trades(
     ticker: str,
     limit: int = 10
@@ -275,13 +383,9 @@ async def get_insider_trades(
     Get recent insider trading activity (buys/sells by executives).
     """
     try:
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/insider-trades/",
-            params={"ticker": ticker, "limit": limit}
-        )
+        data = await _fds_get("/insider-trades/", {"ticker": ticker, "limit": limit})
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             trades = data.get("insider_trades", [])
             
             return {
@@ -294,15 +398,16 @@ async def get_insider_trades(
                     "transaction_shares": trade.get("transaction_shares"),
                     "transaction_value": trade.get("transaction_value"),
                     "shares_owned_after": trade.get("shares_owned_after_transaction")
-                } for trade in trades[:limit]]
+                } for trade in islice(trades, limit)]
             }
         
         return {"error": "Could not fetch insider trades", "ticker": ticker}
     except Exception as e:
-        print(f"❌ Error fetching insider trades: {e}")
+        logger.warning("Error fetching insider trades for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
 @register_tool("get_institutional_ownership")
+@async_ttl_cache(ttl=CACHE_TTL_INSTITUTIONAL)
 async def get_institutional_ownership(
     ticker: str,
     limit: int = 10
@@ -311,13 +416,9 @@ async def get_institutional_ownership(
     Get institutional investors (hedge funds, mutual funds) holding this stock.
     """
     try:
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/institutional-ownership/",
-            params={"ticker": ticker, "limit": limit}
-        )
+        data = await _fds_get("/institutional-ownership/", {"ticker": ticker, "limit": limit})
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             holdings = data.get("institutional-ownership", [])
             
             return {
@@ -328,14 +429,16 @@ async def get_institutional_ownership(
                     "shares": holding.get("shares"),
                     "market_value": holding.get("market_value"),
                     "report_period": holding.get("report_period")
-                } for holding in holdings[:limit]]
+                } for holding in islice(holdings, limit)]
             }
         
         return {"error": "Could not fetch institutional ownership", "ticker": ticker}
     except Exception as e:
-        print(f"❌ Error fetching institutional ownership: {e}")
+        logger.warning("Error fetching institutional ownership for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
+SEARCH_SNIPPET_CHARS = 200
+
 @register_tool("search_stocks")
 async def search_stocks(
     query: str,
@@ -350,7 +453,10 @@ async def search_stocks(
         results = await exa_client.search(
             query=f"stocks ETFs {query}",
             num_results=limit,
-            category="financial report"
+            category="financial report",
+            # Only the snippet is shown, so don't pull full page text over the wire
+            text={"maxCharacters": SEARCH_SNIPPET_CHARS},
+            cache_ttl=CACHE_TTL_EXA_SEARCH
         )
         
         search_results = results.get("results", [])
@@ -360,14 +466,48 @@ async def search_stocks(
             "results_count": len(search_results),
             "matches": [{
                 "title": r.get("title"),
-                "description": r.get("text", "")[:200],
+                "description": (r.get("text") or "")[:SEARCH_SNIPPET_CHARS],
                 "url": r.get("url")
             } for r in search_results]
         }
     except Exception as e:
-        print(f"❌ Error searching stocks: {e}")
+        logger.warning("Error searching stocks for %r: %s", query, e)
         return {"error": str(e), "query": query}
 
+# [last refresh time, ISO string] - second-level precision is plenty for tool timestamps
+_ts_cache = [0, ""]
+
+def _iso_now_cached() -> str:
+    """Current local time as ISO-8601 at second resolution, formatted once per second"""
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache[0] = second
+        _ts_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _ts_cache[1]
+
+# Major indices and sector ETFs shown in the market overview
+_INDEX_TICKERS = (
+    ("S&P 500", "SPY"),
+    ("Nasdaq", "QQQ"),
+    ("Dow Jones", "DIA"),
+)
+_SECTOR_TICKERS = (
+    ("Technology", "XLK"),
+    ("Healthcare", "XLV"),
+    ("Financials", "XLF"),
+    ("Energy", "XLE"),
+    ("Consumer", "XLY"),
+)
+_INDEX_SYMBOLS = tuple(symbol for _, symbol in _INDEX_TICKERS)
+_SECTOR_SYMBOLS = tuple(symbol for _, symbol in _SECTOR_TICKERS)
+
+# Per-branch budget so a slow provider degrades the overview instead of stalling it
+OVERVIEW_TIMEOUT = 3.0
+
+async def _within(coro, timeout: float):
+    """Await coro for at most `timeout` seconds; raises asyncio.TimeoutError past the budget"""
+    return await asyncio.wait_for(coro, timeout)
+
 @register_tool("get_market_overview")
 async def get_market_overview(
     include_indices: bool = True,
@@ -378,65 +518,52 @@ async def get_market_overview(
     Get overall market conditions and sentiment.
     """
     result = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _iso_now_cached(),
         "market_status": "open"  # TODO: Check market hours
     }
     
+    symbols = (_INDEX_SYMBOLS if include_indices else ()) + (_SECTOR_SYMBOLS if include_sectors else ())
+    
+    # One batched quote request, concurrent with the sentiment lookup; each gets its own budget
+    coros = [_within(fd_client.get_quotes_batch(list(symbols), fallback=_bounded_quote, get=_fd_get), OVERVIEW_TIMEOUT)]
+    if include_sentiment:
+        coros.append(_within(exa_client.get_market_sentiment(), OVERVIEW_TIMEOUT))
+    
+    responses = await asyncio.gather(*coros, return_exceptions=True)
+    quotes = responses[0] if not isinstance(responses[0], Exception) else {}
+    
+    def quote_field(symbol: str, field: str):
+        data = quotes.get(symbol)
+        return data[field] if data is not None else 0
+    
     if include_indices:
-        # Get major indices
-        indices = {
-            "S&P 500": "SPY",
-            "Nasdaq": "QQQ",
-            "Dow Jones": "DIA"
-        }
-        
-        index_data = await asyncio.gather(*[
-            fd_client.get_quote(ticker)
-            for ticker in indices.values()
-        ], return_exceptions=True)
-        
         result["indices"] = {
             name: {
-                "price": data["price"] if not isinstance(data, Exception) else 0,
-                "change_percent": data["change_percent"] if not isinstance(data, Exception) else 0
+                "price": quote_field(symbol, "price"),
+                "change_percent": quote_field(symbol, "change_percent")
             }
-            for name, data in zip(indices.keys(), index_data)
+            for name, symbol in _INDEX_TICKERS
         }
     
     if include_sectors:
-        # Get sector performance
-        sector_etfs = {
-            "Technology": "XLK",
-            "Healthcare": "XLV",
-            "Financials": "XLF",
-            "Energy": "XLE",
-            "Consumer": "XLY"
-        }
-        
-        sector_data = await asyncio.gather(*[
-            fd_client.get_quote(ticker)
-            for ticker in sector_etfs.values()
-        ], return_exceptions=True)
-        
         result["sectors"] = {
             name: {
-                "change_percent": data["change_percent"] if not isinstance(data, Exception) else 0
+                "change_percent": quote_field(symbol, "change_percent")
             }
-            for name, data in zip(sector_etfs.keys(), sector_data)
+            for name, symbol in _SECTOR_TICKERS
         }
         
-        # Sort sectors
-        sorted_sectors = sorted(
-            result["sectors"].items(),
-            key=lambda x: x[1]["change_percent"],
-            reverse=True
-        )
-        result["top_sectors"] = sorted_sectors[:2]
-        result["worst_sectors"] = sorted_sectors[-2:]
+        # Pick best/worst sectors without a full sort
+        by_change = lambda x: x[1]["change_percent"]
+        result["top_sectors"] = heapq.nlargest(2, result["sectors"].items(), key=by_change)
+        # Keep the previous best-to-worst ordering within the pair
+        result["worst_sectors"] = heapq.nsmallest(2, result["sectors"].items(), key=by_change)[::-1]
     
     if include_sentiment:
         # Get market sentiment from news
-        news_sentiment = await exa_client.get_market_sentiment()
+        news_sentiment = responses[1]
+        if isinstance(news_sentiment, Exception):
+            news_sentiment = {}
         
         result["sentiment"] = {
             "score": news_sentiment.get("score", 0),
@@ -446,6 +573,27 @@ async def get_market_overview(
     
     return result
 
+# Shared AlphaWealthSystem - building one constructs every specialist agent
+_alpha_system = None
+_alpha_system_lock = asyncio.Lock()
+
+def set_alpha_system(system) -> None:
+    """Reuse an already-built system (the app's startup instance) for analyze_stock"""
+    global _alpha_system
+    _alpha_system = system
+
+async def _get_alpha_system():
+    global _alpha_system
+    # Fast path once set; the lock only serializes first construction
+    if _alpha_system is not None:
+        return _alpha_system
+    async with _alpha_system_lock:
+        if _alpha_system is None:
+            # Import here to avoid circular dependencies
+            from agents.system import AlphaWealthSystem
+            _alpha_system = AlphaWealthSystem()
+    return _alpha_system
+
 @register_tool("analyze_stock")
 async def analyze_stock(
     ticker: str,
@@ -456,11 +604,7 @@ async def analyze_stock(
     Comprehensive stock analysis using specialist agents.
     This is a heavy operation - imports the full system.
     """
-    
-    # Import here to avoid circular dependencies
-    from agents.system import AlphaWealthSystem
-    
-    system = AlphaWealthSystem()
+    system = await _get_alpha_system()
     
     result = await system.analyze_stock(
         ticker=ticker,
@@ -481,35 +625,43 @@ async def compare_stocks(
     if not metrics:
         metrics = ["price", "pe_ratio", "market_cap", "revenue_growth"]
     
-    # Get data for each ticker in parallel
-    stock_data = await asyncio.gather(*[
-        _get_comparison_data(ticker, metrics)
-        for ticker in tickers
-    ], return_exceptions=True)
+    needs_quote = "price" in metrics or "market_cap" in metrics
+    needs_metrics = "pe_ratio" in metrics
+    
+    # Issue every quote and metrics request across tickers in one wave
+    tasks = []
+    if needs_quote:
+        tasks.extend(_bounded_quote(ticker) for ticker in tickers)
+    if needs_metrics:
+        tasks.extend(get_financial_metrics(ticker) for ticker in tickers)
+    
+    responses = await asyncio.gather(*tasks, return_exceptions=True)
+    n = len(tickers)
+    quotes = responses[:n] if needs_quote else [None] * n
+    metrics_results = responses[-n:] if needs_metrics else [None] * n
+    
+    comparison = {}
+    for ticker, quote, metrics_data in zip(tickers, quotes, metrics_results):
+        failed = next((r for r in (quote, metrics_data) if isinstance(r, Exception)), None)
+        if failed is not None:
+            comparison[ticker] = {"error": str(failed)}
+            continue
+        
+        data = {}
+        if needs_quote:
+            data["price"] = quote["price"]
+            data["market_cap"] = quote.get("market_cap")
+        if needs_metrics:
+            data["pe_ratio"] = metrics_data.get("pe_ratio")
+        comparison[ticker] = data
     
     return {
         "tickers": tickers,
-        "comparison": {
-            ticker: data if not isinstance(data, Exception) else {"error": str(data)}
-            for ticker, data in zip(tickers, stock_data)
-        },
+        "comparison": comparison,
         "metrics": metrics
     }
 
-async def _get_comparison_data(ticker: str, metrics: List[str]) -> Dict[str, Any]:
-    """Helper to get comparison data for a ticker"""
-    data = {}
-    
-    if "price" in metrics or "market_cap" in metrics:
-        quote = await fd_client.get_quote(ticker)
-        data["price"] = quote["price"]
-        data["market_cap"] = quote.get("market_cap")
-    
-    if "pe_ratio" in metrics:
-        metrics_data = await fd_client.get_financial_metrics(ticker)
-        data["pe_ratio"] = metrics_data.get("pe_ratio")
-    
-    return data
+RESEARCH_SOURCE_COUNT = 5
 
 @register_tool("research_topic")
 async def research_topic(
@@ -520,16 +672,20 @@ async def research_topic(
     Research a financial topic, concept, or strategy.
     Examples: "What are REITs?", "Explain P/E ratio", "How does DCF work?"
     """
-    # Use Exa to search for educational content
-    search_results = await exa_client.search(
-        query=topic,
-        num_results=10,
-        category="research paper"
+    # Use Exa to search for educational content (only the top sources are used),
+    # finding examples while the search is in flight
+    search_results, examples = await asyncio.gather(
+        exa_client.search(
+            query=topic,
+            num_results=RESEARCH_SOURCE_COUNT,
+            category="research paper",
+            cache_ttl=CACHE_TTL_EXA_SEARCH
+        ),
+        _find_examples(topic)
     )
     
     # Extract and synthesize information
     explanation = await _synthesize_explanation(topic, search_results)
-    examples = await _find_examples(topic)
     
     return {
         "topic": topic,
@@ -537,36 +693,23 @@ async def research_topic(
         "examples": examples,
         "sources": [
             {"title": r.get("title"), "url": r.get("url")}
-            for r in search_results.get("results", [])[:5]
+            for r in search_results.get("results", [])[:RESEARCH_SOURCE_COUNT]
         ]
     }
 
-@register_tool("analyze_portfolio")
-async def analyze_portfolio(
-    holdings: List[Dict[str, Any]] = None
-) -> Dict[str, Any]:
-    """
-    Analyze user's portfolio for risk, diversification, and optimization.
-    holdings format: [{"ticker": "AAPL", "shares": 10, "cost_basis": 150}, ...]
-    """
-    if not holdings:
-        return {"error": "No holdings provided"}
-    
-    # Get current prices for all holdings
-    tickers = [h["ticker"] for h in holdings]
-    quotes = await asyncio.gather(*[
-        fd_client.get_quote(ticker)
-        for ticker in tickers
-    ], return_exceptions=True)
-    
-    total_value = 0
+# Below this many positions plain Python beats NumPy's per-call overhead
+VECTORIZE_MIN_POSITIONS = 64
+
+def _portfolio_positions(priced: List[tuple]) -> tuple:
+    """Build position rows and the portfolio total from (holding, quote) pairs"""
+    # Total first, so allocation can be filled in as each row is built
+    values = [holding["shares"] * quote["price"] for holding, quote in priced]
+    total_value = sum(values)
+    # One division up front; each row's allocation is then a multiply
+    alloc_scale = 100.0 / total_value if total_value else 0.0
     positions = []
     
-    for holding, quote in zip(holdings, quotes):
-        if isinstance(quote, Exception):
-            continue
-            
-        current_value = holding["shares"] * quote["price"]
+    for (holding, quote), current_value in zip(priced, values):
         cost_basis = holding["shares"] * holding.get("cost_basis", quote["price"])
         
         positions.append({
@@ -576,20 +719,84 @@ async def analyze_portfolio(
             "current_value": current_value,
             "cost_basis": cost_basis,
             "gain_loss": current_value - cost_basis,
-            "gain_loss_pct": ((current_value - cost_basis) / cost_basis * 100) if cost_basis else 0
+            "gain_loss_pct": ((current_value - cost_basis) / cost_basis * 100) if cost_basis else 0,
+            "allocation_pct": current_value * alloc_scale
         })
-        
-        total_value += current_value
     
-    # Calculate allocation percentages
-    for pos in positions:
-        pos["allocation_pct"] = (pos["current_value"] / total_value * 100) if total_value else 0
+    return positions, total_value
+
+def _portfolio_positions_vectorized(priced: List[tuple]) -> tuple:
+    """NumPy version of _portfolio_positions for large portfolios"""
+    n = len(priced)
+    shares = np.fromiter((h["shares"] for h, _ in priced), dtype=np.float64, count=n)
+    prices = np.fromiter((q["price"] for _, q in priced), dtype=np.float64, count=n)
+    unit_cost = np.fromiter(
+        (h.get("cost_basis", q["price"]) for h, q in priced), dtype=np.float64, count=n
+    )
+    
+    current_value = shares * prices
+    cost_basis = shares * unit_cost
+    gain_loss = current_value - cost_basis
+    gain_loss_pct = np.divide(gain_loss, cost_basis, out=np.zeros(n), where=cost_basis != 0) * 100
+    total_value = float(current_value.sum())
+    allocation_pct = current_value * (100.0 / total_value if total_value else 0.0)
+    
+    positions = [
+        {
+            "ticker": holding["ticker"],
+            "shares": holding["shares"],
+            "current_price": quote["price"],
+            "current_value": cv,
+            "cost_basis": cb,
+            "gain_loss": gl,
+            "gain_loss_pct": glp,
+            "allocation_pct": alloc
+        }
+        for (holding, quote), cv, cb, gl, glp, alloc in zip(
+            priced,
+            current_value.tolist(),
+            cost_basis.tolist(),
+            gain_loss.tolist(),
+            gain_loss_pct.tolist(),
+            allocation_pct.tolist()
+        )
+    ]
+    return positions, total_value
+
+@register_tool("analyze_portfolio")
+async def analyze_portfolio(
+    holdings: List[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Analyze user's portfolio for risk, diversification, and optimization.
+    holdings format: [{"ticker": "AAPL", "shares": 10, "cost_basis": 150}, ...]
+    """
+    if not holdings:
+        return {"error": "No holdings provided"}
+    
+    # Get current prices once per distinct ticker (lots often repeat a ticker)
+    # Batched snapshot requests; anything left over goes through the bounded per-ticker path
+    unique_tickers = list(dict.fromkeys(h["ticker"] for h in holdings))
+    quote_by_ticker = await fd_client.get_quotes_batch(unique_tickers, fallback=_bounded_quote, get=_fd_get)
+    
+    # Tickers whose quote failed are missing from the map; skip those lots
+    priced = [
+        (holding, quote)
+        for holding in holdings
+        if (quote := quote_by_ticker.get(holding["ticker"])) is not None
+    ]
+    
+    # Vectorize the arithmetic for large imported portfolios
+    if NUMPY_AVAILABLE and len(priced) >= VECTORIZE_MIN_POSITIONS:
+        positions, total_value = _portfolio_positions_vectorized(priced)
+    else:
+        positions, total_value = _portfolio_positions(priced)
     
     return {
         "total_value": total_value,
         "positions": positions,
         "position_count": len(positions),
-        "top_holdings": sorted(positions, key=lambda x: x["allocation_pct"], reverse=True)[:5]
+        "top_holdings": heapq.nlargest(5, positions, key=lambda x: x["allocation_pct"])
     }
 
 @register_tool("generate_chart")
@@ -631,7 +838,7 @@ async def generate_chart(
         }
     
     except Exception as e:
-        print(f"❌ Error generating chart: {e}")
+        logger.warning("Error generating chart for %s: %s", ticker, e)
         return {"error": str(e), "ticker": ticker}
 
 @register_tool("generate_comparison_chart")
@@ -661,10 +868,11 @@ async def generate_comparison_chart(
         }
     
     except Exception as e:
-        print(f"❌ Error generating comparison chart: {e}")
+        logger.warning("Error generating comparison chart for %s: %s", tickers, e)
         return {"error": str(e), "tickers": tickers}
 
 @register_tool("generate_sector_heatmap")
+@async_ttl_cache(ttl=CACHE_TTL_MOVERS)
 async def generate_sector_heatmap() -> Dict[str, Any]:
     """
     Generate sector performance heatmap showing which sectors are hot/cold today.
@@ -684,7 +892,7 @@ async def generate_sector_heatmap() -> Dict[str, Any]:
         }
     
     except Exception as e:
-        print(f"❌ Error generating sector heatmap: {e}")
+        logger.warning("Error generating sector heatmap: %s", e)
         return {"error": str(e)}
 
 @register_tool("screen_stocks")
@@ -725,10 +933,11 @@ async def screen_stocks(
         }
     
     except Exception as e:
-        print(f"❌ Error screening stocks: {e}")
+        logger.warning("Error screening stocks for %r: %s", criteria, e)
         return {"error": str(e)}
 
 @register_tool("get_top_gainers")
+@async_ttl_cache(ttl=CACHE_TTL_MOVERS)
 async def get_top_gainers(limit: int = 10) -> Dict[str, Any]:
     """
     Get today's top gaining stocks. Use when user asks "what stocks are up today" or "top gainers".
@@ -743,10 +952,11 @@ async def get_top_gainers(limit: int = 10) -> Dict[str, Any]:
         }
     
     except Exception as e:
-        print(f"❌ Error getting top gainers: {e}")
+        logger.warning("Error getting top gainers: %s", e)
         return {"error": str(e)}
 
 @register_tool("get_top_losers")
+@async_ttl_cache(ttl=CACHE_TTL_MOVERS)
 async def get_top_losers(limit: int = 10) -> Dict[str, Any]:
     """
     Get today's worst performing stocks. Use when user asks "what stocks are down" or "top losers".
@@ -761,10 +971,11 @@ async def get_top_losers(limit: int = 10) -> Dict[str, Any]:
         }
     
     except Exception as e:
-        print(f"❌ Error getting top losers: {e}")
+        logger.warning("Error getting top losers: %s", e)
         return {"error": str(e)}
 
 @register_tool("get_most_active")
+@async_ttl_cache(ttl=CACHE_TTL_MOVERS)
 async def get_most_active(limit: int = 10) -> Dict[str, Any]:
     """
     Get most actively traded stocks. Use when user asks "most active stocks" or "highest volume".
@@ -779,48 +990,59 @@ async def get_most_active(limit: int = 10) -> Dict[str, Any]:
         }
     
     except Exception as e:
-        print(f"❌ Error getting most active stocks: {e}")
+        logger.warning("Error getting most active stocks: %s", e)
         return {"error": str(e)}
 
+# One alternation pass instead of a cascade of substring checks.
+# Longer phrases come first so "undervalued" isn't reported as "value".
+# Leading boundary only, so plurals ("dividends", "small caps") still match
+_CRITERIA_RE = re.compile(r"\b(?:undervalued|value|low pe|growth|dividend|large cap|mid cap|small cap|profitable)")
+
 def _parse_screening_criteria(criteria_text: str) -> Dict[str, Any]:
     """Parse natural language screening criteria into filters"""
+    # Copy so callers can't mutate the cached entry
+    return dict(_criteria_for_text(criteria_text.lower()))
+
+@lru_cache(maxsize=256)
+def _criteria_for_text(text_lower: str) -> Dict[str, Any]:
     criteria = {}
-    text_lower = criteria_text.lower()
+    hits = set(_CRITERIA_RE.findall(text_lower))
+    is_value = "value" in hits or "undervalued" in hits
     
     # Value stocks
-    if "value" in text_lower or "undervalued" in text_lower or "low pe" in text_lower:
+    if is_value or "low pe" in hits:
         criteria["max_pe_ratio"] = 20
         criteria["min_profit_margin"] = 5
     
     # Growth stocks  
-    if "growth" in text_lower or "high growth" in text_lower:
+    if "growth" in hits:
         criteria["min_profit_margin"] = 15
         criteria["min_market_cap"] = 5000000000
     
     # Dividend stocks
-    if "dividend" in text_lower:
+    if "dividend" in hits:
         # Will need dividend data from FDS
         pass
     
     # Size filters
-    if "large cap" in text_lower:
+    if "large cap" in hits:
         criteria["min_market_cap"] = 10000000000
-    elif "mid cap" in text_lower:
+    elif "mid cap" in hits:
         criteria["min_market_cap"] = 2000000000
         criteria["max_market_cap"] = 10000000000
-    elif "small cap" in text_lower:
+    elif "small cap" in hits:
         criteria["max_market_cap"] = 2000000000
     
     # Profitability
-    if "profitable" in text_lower:
+    if "profitable" in hits:
         criteria["min_profit_margin"] = 0
     
     # Default sorting
     if not criteria.get("sort_by"):
-        if "value" in text_lower:
+        if is_value:
             criteria["sort_by"] = "pe_ratio"
             criteria["sort_order"] = "asc"
-        elif "growth" in text_lower:
+        elif "growth" in hits:
             criteria["sort_by"] = "profit_margin"
             criteria["sort_order"] = "desc"
         else:
@@ -835,7 +1057,48 @@ async def _synthesize_explanation(topic: str, content: Any) -> str:
     # Placeholder - would use LLM to synthesize
     return f"Research on {topic} is being compiled from authoritative sources..."
 
+def _exa_search_key(query: str, num_results: int = 10, category: str = None, include_text: bool = True):
+    return (query.lower().strip(), num_results, category, include_text)
+
+# Exa retries: transient 429/5xx and transport errors back off and try again
+EXA_MAX_RETRIES = 4
+_EXA_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+def _retry_delay(attempt: int, response=None) -> float:
+    """Honor a numeric Retry-After when given, else capped exponential backoff with jitter"""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), 8.0)
+    return min(2 ** attempt * 0.25, 8.0) + random.uniform(0, 0.25)
+
+async def _exa_post(path: str, payload, *, max_retries: int = EXA_MAX_RETRIES):
+    """POST a JSON payload (dict, or pre-encoded bytes) to the Exa API, retrying transient failures"""
+    body = payload if isinstance(payload, bytes) else _json_dumps(payload)
+    for attempt in range(max_retries + 1):
+        try:
+            # The client carries the Exa base URL, so relative paths resolve against it.
+            # Slot held only for the request itself, not the retry backoff.
+            async with exa_client.semaphore:
+                response = await exa_client.client.post(path, content=body)
+        except httpx.TransportError:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+        
+        if response.status_code not in _EXA_RETRY_STATUSES or attempt == max_retries:
+            return response
+        await asyncio.sleep(_retry_delay(attempt, response))
+
+# The key is read once by ExaClient and baked into its headers
+_EXA_ENABLED = bool(exa_client.api_key)
+
+# Fixed-shape request bodies, filled with JSON-encoded values (no dict build per call)
+_FIND_SIMILAR_TMPL = b'{"url":%b,"numResults":%d,"text":true}'
+_ANSWER_TMPL = b'{"query":%b,"text":true}'
+
 @register_tool("exa_search")
+@async_ttl_cache(ttl=CACHE_TTL_EXA_SEARCH, key=_exa_search_key)
 async def exa_search(
     query: str,
     num_results: int = 10,
@@ -847,59 +1110,52 @@ async def exa_search(
     Great for finding recent articles, research papers, or specific information.
     """
     try:
-        import httpx
-        exa_api_key = os.getenv("EXA_API_KEY", "")
-        
-        if not exa_api_key:
+        if not _EXA_ENABLED:
             return {"error": "EXA_API_KEY not configured"}
         
-        async with httpx.AsyncClient() as client:
-            payload = {
+        payload = {
+            "query": query,
+            "numResults": num_results,
+            "type": "auto"
+        }
+        
+        if category:
+            payload["category"] = category
+        
+        if include_text:
+            payload["text"] = True
+        
+        # Reuse the pooled Exa client so warm calls skip the TCP/TLS handshake
+        response = await _exa_post(
+            "/search",
+            payload
+        )
+        
+        if response.status_code == 200:
+            data = _load_json(response)
+            results = data.get("results", [])
+            
+            return {
                 "query": query,
-                "numResults": num_results,
-                "type": "auto"
+                "results_count": len(results),
+                "results": [{
+                    "title": r.get("title"),
+                    "url": r.get("url"),
+                    "published_date": r.get("publishedDate"),
+                    "author": r.get("author"),
+                    "score": r.get("score"),
+                    "text_snippet": body[:500] if (body := r.get("text")) else None
+                } for r in results]
             }
-            
-            if category:
-                payload["category"] = category
-            
-            if include_text:
-                payload["text"] = True
-            
-            response = await client.post(
-                "https://api.exa.ai/search",
-                headers={
-                    "x-api-key": exa_api_key,
-                    "Content-Type": "application/json"
-                },
-                json=payload,
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get("results", [])
-                
-                return {
-                    "query": query,
-                    "results_count": len(results),
-                    "results": [{
-                        "title": r.get("title"),
-                        "url": r.get("url"),
-                        "published_date": r.get("publishedDate"),
-                        "author": r.get("author"),
-                        "score": r.get("score"),
-                        "text_snippet": r.get("text", "")[:500] if r.get("text") else None
-                    } for r in results]
-                }
-            else:
-                return {"error": f"Exa API returned {response.status_code}", "details": response.text[:200]}
-    
+        else:
+            return {"error": f"Exa API returned {response.status_code}", "details": response.text[:200]}
+
     except Exception as e:
-        print(f"❌ Error in exa_search: {e}")
+        logger.exception("exa_search failed for %r", query)
         return {"error": str(e)}
 
 @register_tool("exa_find_similar")
+@async_ttl_cache(ttl=CACHE_TTL_EXA_SIMILAR)
 async def exa_find_similar(
     url: str,
     num_results: int = 10
@@ -909,49 +1165,119 @@ async def exa_find_similar(
     Useful for finding related research, similar companies, or comparable articles.
     """
     try:
-        import httpx
-        exa_api_key = os.getenv("EXA_API_KEY", "")
-        
-        if not exa_api_key:
+        # Key is read once when ExaClient is built and sent as a client header
+        if not _EXA_ENABLED:
             return {"error": "EXA_API_KEY not configured"}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.exa.ai/findSimilar",
-                headers={
-                    "x-api-key": exa_api_key,
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "url": url,
-                    "numResults": num_results,
-                    "text": True
-                },
-                timeout=30.0
-            )
+        response = await _exa_post(
+            "/findSimilar",
+            _FIND_SIMILAR_TMPL % (_json_dumps(url), int(num_results))
+        )
+        
+        if response.status_code == 200:
+            data = _load_json(response)
+            results = data.get("results", [])
             
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get("results", [])
-                
-                return {
-                    "original_url": url,
-                    "results_count": len(results),
-                    "similar_pages": [{
-                        "title": r.get("title"),
-                        "url": r.get("url"),
-                        "score": r.get("score"),
-                        "author": r.get("author")
-                    } for r in results]
-                }
-            else:
-                return {"error": f"Exa API returned {response.status_code}"}
-    
+            return {
+                "original_url": url,
+                "results_count": len(results),
+                "similar_pages": [{
+                    "title": r.get("title"),
+                    "url": r.get("url"),
+                    "score": r.get("score"),
+                    "author": r.get("author")
+                } for r in results]
+            }
+        else:
+            return {"error": f"Exa API returned {response.status_code}"}
+
     except Exception as e:
-        print(f"❌ Error in exa_find_similar: {e}")
+        logger.exception("exa_find_similar failed for %s", url)
         return {"error": str(e)}
 
+# /contents coalescing: wait this long (or until this many URLs) before sending
+EXA_CONTENTS_BATCH_WINDOW = 0.02
+EXA_CONTENTS_BATCH_MAX_URLS = 32
+
+class _ContentsBatcher:
+    """Merges concurrent exa_get_contents requests into one /contents POST"""
+    
+    def __init__(self, window: float, max_urls: int):
+        self.window = window
+        self.max_urls = max_urls
+        self._pending = []  # (urls, include_text, include_summary, future)
+        self._pending_urls = 0
+        self._flush_handle = None
+        self._tasks = set()  # strong refs so in-flight sends aren't garbage collected
+    
+    async def fetch(self, urls: List[str], include_text: bool, include_summary: bool) -> tuple:
+        """Returns (status_code, results) for this caller's URLs"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((urls, include_text, include_summary, future))
+        self._pending_urls += len(urls)
+        
+        if self._pending_urls >= self.max_urls:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await future
+    
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending, self._pending_urls = self._pending, [], 0
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, batch: List[tuple]):
+        payload = {"urls": list(dict.fromkeys(url for urls, _, _, _ in batch for url in urls))}
+        
+        # Flags are OR'd across callers; fields a caller didn't ask for are dropped below
+        if any(include_text for _, include_text, _, _ in batch):
+            payload["text"] = {"maxCharacters": 2000}
+        
+        if any(include_summary for _, _, include_summary, _ in batch):
+            payload["summary"] = {"query": "Key points and main ideas"}
+        
+        try:
+            response = await _exa_post(
+                "/contents",
+                payload
+            )
+            results = _load_json(response).get("results", []) if response.status_code == 200 else []
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for urls, include_text, include_summary, future in batch:
+            if future.done():
+                continue
+            if len(batch) == 1:
+                mine = results
+            else:
+                wanted = set(urls)
+                mine = [r for r in results if r.get("id") in wanted or r.get("url") in wanted]
+            if not (include_text and include_summary):
+                mine = [
+                    {
+                        **r,
+                        "text": r.get("text") if include_text else None,
+                        "summary": r.get("summary") if include_summary else None
+                    }
+                    for r in mine
+                ]
+            future.set_result((response.status_code, mine))
+
+_contents_batcher = _ContentsBatcher(EXA_CONTENTS_BATCH_WINDOW, EXA_CONTENTS_BATCH_MAX_URLS)
+
 @register_tool("exa_get_contents")
+@async_ttl_cache(ttl=CACHE_TTL_EXA_CONTENTS)
 async def exa_get_contents(
     urls: List[str],
     include_text: bool = True,
@@ -962,54 +1288,34 @@ async def exa_get_contents(
     Useful for extracting full text, summaries, or highlights from web pages.
     """
     try:
-        import httpx
-        exa_api_key = os.getenv("EXA_API_KEY", "")
-        
-        if not exa_api_key:
+        # Key is read once when ExaClient is built and sent as a client header
+        if not _EXA_ENABLED:
             return {"error": "EXA_API_KEY not configured"}
         
-        async with httpx.AsyncClient() as client:
-            payload = {"urls": urls}
-            
-            if include_text:
-                payload["text"] = {"maxCharacters": 2000}
-            
-            if include_summary:
-                payload["summary"] = {"query": "Key points and main ideas"}
-            
-            response = await client.post(
-                "https://api.exa.ai/contents",
-                headers={
-                    "x-api-key": exa_api_key,
-                    "Content-Type": "application/json"
-                },
-                json=payload,
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get("results", [])
-                
-                return {
-                    "urls_count": len(urls),
-                    "contents": [{
-                        "url": r.get("url"),
-                        "title": r.get("title"),
-                        "text": r.get("text"),
-                        "summary": r.get("summary"),
-                        "author": r.get("author"),
-                        "published_date": r.get("publishedDate")
-                    } for r in results]
-                }
-            else:
-                return {"error": f"Exa API returned {response.status_code}"}
-    
+        # Concurrent callers within a few ms share one /contents request
+        status_code, results = await _contents_batcher.fetch(urls, include_text, include_summary)
+        
+        if status_code == 200:
+            return {
+                "urls_count": len(urls),
+                "contents": [{
+                    "url": r.get("url"),
+                    "title": r.get("title"),
+                    "text": r.get("text"),
+                    "summary": r.get("summary"),
+                    "author": r.get("author"),
+                    "published_date": r.get("publishedDate")
+                } for r in results]
+            }
+        else:
+            return {"error": f"Exa API returned {status_code}"}
+
     except Exception as e:
-        print(f"❌ Error in exa_get_contents: {e}")
+        logger.exception("exa_get_contents failed for %d urls", len(urls))
         return {"error": str(e)}
 
 @register_tool("exa_answer")
+@async_ttl_cache(ttl=CACHE_TTL_EXA_ANSWER)
 async def exa_answer(
     query: str
 ) -> Dict[str, Any]:
@@ -1019,44 +1325,33 @@ async def exa_answer(
     Great for factual questions about markets, companies, or financial concepts.
     """
     try:
-        import httpx
-        exa_api_key = os.getenv("EXA_API_KEY", "")
-        
-        if not exa_api_key:
+        # Key is read once when ExaClient is built and sent as a client header
+        if not _EXA_ENABLED:
             return {"error": "EXA_API_KEY not configured"}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.exa.ai/answer",
-                headers={
-                    "x-api-key": exa_api_key,
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "query": query,
-                    "text": True
-                },
-                timeout=30.0
-            )
+        response = await _exa_post(
+            "/answer",
+            _ANSWER_TMPL % _json_dumps(query)
+        )
+        
+        if response.status_code == 200:
+            data = _load_json(response)
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                return {
-                    "query": query,
-                    "answer": data.get("answer"),
-                    "citations": [{
-                        "title": c.get("title"),
-                        "url": c.get("url"),
-                        "published_date": c.get("publishedDate"),
-                        "author": c.get("author")
-                    } for c in data.get("citations", [])]
-                }
-            else:
-                return {"error": f"Exa API returned {response.status_code}"}
-    
+            return {
+                "query": query,
+                "answer": data.get("answer"),
+                "citations": [{
+                    "title": c.get("title"),
+                    "url": c.get("url"),
+                    "published_date": c.get("publishedDate"),
+                    "author": c.get("author")
+                } for c in data.get("citations", [])]
+            }
+        else:
+            return {"error": f"Exa API returned {response.status_code}"}
+
     except Exception as e:
-        print(f"❌ Error in exa_answer: {e}")
+        logger.exception("exa_answer failed for %r", query)
         return {"error": str(e)}
 
 async def _find_examples(topic: str) -> List[str]:
@@ -1064,22 +1359,30 @@ async def _find_examples(topic: str) -> List[str]:
     # Placeholder
     return ["Example 1", "Example 2", "Example 3"]
 
+_TIMEFRAMES = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(days=1),
+    "1W": timedelta(weeks=1),
+    "1M": timedelta(days=30),
+}
+# timeframe -> (epoch second it was computed in, formatted date)
+_start_date_cache: Dict[str, tuple] = {}
+
 def _get_start_date(timeframe: str) -> str:
     """Convert timeframe to start date"""
-    now = datetime.now()
-    if timeframe == "1h":
-        start = now - timedelta(hours=1)
-    elif timeframe == "24h":
-        start = now - timedelta(days=1)
-    elif timeframe == "1W":
-        start = now - timedelta(weeks=1)
-    else:  # 1M
-        start = now - timedelta(days=30)
+    delta = _TIMEFRAMES.get(timeframe, _TIMEFRAMES["1M"])
+    second = int(time.time())
+    cached = _start_date_cache.get(timeframe)
+    if cached is not None and cached[0] == second:
+        return cached[1]
     
-    return start.strftime("%Y-%m-%d")
+    start = (datetime.now() - delta).strftime("%Y-%m-%d")
+    _start_date_cache[timeframe] = (second, start)
+    return start
 
 
 @register_tool("get_earnings_calendar")
+@async_ttl_cache(ttl=CACHE_TTL_EARNINGS)
 async def get_earnings_calendar(
     ticker: str = None,
     days_ahead: int = 30
@@ -1092,13 +1395,9 @@ async def get_earnings_calendar(
         if ticker:
             params["ticker"] = ticker
         
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/earnings/calendar/",
-            params=params
-        )
+        data = await _fds_get_revalidated("/earnings/calendar/", params)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             earnings = data.get("earnings", [])
             
             return {
@@ -1121,22 +1420,19 @@ async def get_earnings_calendar(
         }
     
     except Exception as e:
-        print(f"❌ Error fetching earnings calendar: {e}")
+        logger.warning("Error fetching earnings calendar for %s: %s", ticker or "all", e)
         return {"error": str(e)}
 
 @register_tool("get_analyst_ratings")
+@async_ttl_cache(ttl=CACHE_TTL_ANALYST_RATINGS)
 async def get_analyst_ratings(ticker: str) -> Dict[str, Any]:
     """
     Get analyst ratings and price targets for a stock.
     """
     try:
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/analyst-ratings/",
-            params={"ticker": ticker}
-        )
+        data = await _fds_get_revalidated("/analyst-ratings/", {"ticker": ticker})
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             
             return {
                 "ticker": ticker,
@@ -1158,7 +1454,7 @@ async def get_analyst_ratings(ticker: str) -> Dict[str, Any]:
         return {"error": "Analyst ratings not available", "ticker": ticker}
     
     except Exception as e:
-        print(f"❌ Error fetching analyst ratings: {e}")
+        logger.warning("Error fetching analyst ratings for %s: %s", ticker, e)
         return {"error": str(e)}
 
 @register_tool("search_institutional_investor")
@@ -1175,13 +1471,13 @@ async def search_institutional_investor(
         if ticker:
             params["ticker"] = ticker
         
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/institutional-ownership/",
+        response = await _fd_get(
+            "/institutional-ownership/",
             params=params
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = _load_json(response)
             holdings = data.get("holdings", [])
             
             result = {
@@ -1224,7 +1520,7 @@ async def search_institutional_investor(
         }
     
     except Exception as e:
-        print(f"❌ Error searching institutional investor: {e}")
+        logger.warning("Error searching institutional investor %r: %s", investor_name, e)
         return {"error": str(e), "investor": investor_name}
 
 @register_tool("calculate_dcf")
@@ -1237,50 +1533,48 @@ async def calculate_dcf(
     Calculate DCF (Discounted Cash Flow) valuation for intrinsic value.
     """
     try:
-        # Get cash flow data
-        cf_response = await fd_client.client.get(
-            f"{fd_client.base_url}/financials/cash-flow-statements/",
-            params={"ticker": ticker, "period": "annual", "limit": 5}
-        )
-        
-        # Get current price
-        price_response = await fd_client.client.get(
-            f"{fd_client.base_url}/prices/snapshot/",
-            params={"ticker": ticker}
+        # Cash flow data and current price are independent - fetch them together
+        cf_response, price_response = await asyncio.gather(
+            _fd_get(
+                "/financials/cash-flow-statements/",
+                params={"ticker": ticker, "period": "annual", "limit": 5}
+            ),
+            _fd_get(
+                "/prices/snapshot/",
+                params={"ticker": ticker}
+            )
         )
         
         if cf_response.status_code == 200 and price_response.status_code == 200:
-            cf_data = cf_response.json()
-            price_data = price_response.json()
+            cf_data = _load_json(cf_response)
+            price_data = _load_json(price_response)
             
             cash_flows = cf_data.get("cash_flow_statements", [])
             if not cash_flows:
                 return {"error": "Insufficient cash flow data", "ticker": ticker}
             
             # Get latest FCF
-            latest_fcf = cash_flows[0].get("free_cash_flow", 0)
+            latest_fcf = cash_flows[0].get("free_cash_flow") or 0
             
             # Simple DCF calculation
             years = 5
             terminal_growth = 3.0  # Terminal growth rate
-            projected_fcf = []
+            growth = 1 + growth_rate / 100
+            discount = 1 + discount_rate / 100
             
-            for year in range(1, years + 1):
-                fcf = latest_fcf * ((1 + growth_rate / 100) ** year)
-                pv = fcf / ((1 + discount_rate / 100) ** year)
-                projected_fcf.append({
-                    "year": year,
-                    "fcf": fcf,
-                    "present_value": pv
-                })
+            # Present value of each projected year's FCF (only the total is reported)
+            projected_pv = sum(
+                latest_fcf * growth ** year / discount ** year
+                for year in range(1, years + 1)
+            )
             
             # Terminal value
-            terminal_fcf = latest_fcf * ((1 + growth_rate / 100) ** years) * (1 + terminal_growth / 100)
+            terminal_fcf = latest_fcf * growth ** years * (1 + terminal_growth / 100)
             terminal_value = terminal_fcf / (discount_rate / 100 - terminal_growth / 100)
-            terminal_pv = terminal_value / ((1 + discount_rate / 100) ** years)
+            terminal_pv = terminal_value / discount ** years
             
             # Enterprise value
-            enterprise_value = sum([p["present_value"] for p in projected_fcf]) + terminal_pv
+            enterprise_value = projected_pv + terminal_pv
             
             # Get shares outstanding
             snapshot = price_data.get("snapshot", {})
@@ -1311,12 +1605,11 @@ async def calculate_dcf(
         return {"error": "Unable to calculate DCF", "ticker": ticker}
     
     except Exception as e:
-        print(f"❌ Error calculating DCF: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating DCF for %s", ticker)
         return {"error": str(e)}
 
 @register_tool("get_earnings_history")
+@async_ttl_cache(ttl=CACHE_TTL_EARNINGS)
 async def get_earnings_history(
     ticker: str,
     limit: int = 8
@@ -1325,13 +1618,9 @@ async def get_earnings_history(
     Get historical earnings results and surprises.
     """
     try:
-        response = await fd_client.client.get(
-            f"{fd_client.base_url}/earnings/history/",
-            params={"ticker": ticker, "limit": limit}
-        )
+        data = await _fds_get_revalidated("/earnings/history/", {"ticker": ticker, "limit": limit})
         
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             earnings = data.get("earnings", [])
             
             return {
@@ -1351,9 +1640,35 @@ async def get_earnings_history(
         return {"error": "Earnings history not available", "ticker": ticker}
     
     except Exception as e:
-        print(f"❌ Error fetching earnings history: {e}")
+        logger.warning("Error fetching earnings history for %s: %s", ticker, e)
         return {"error": str(e)}
 
+def _merge_search_results(responses: List[Any]) -> List[Dict[str, Any]]:
+    """Concatenate Exa search results in order, skipping searches that failed"""
+    merged = []
+    for response in responses:
+        if isinstance(response, Exception):
+            logger.warning("Exa search failed: %s", response)
+            continue
+        merged.extend(response.get("results", []))
+    return merged
+
+def _dedupe_by_url(results: List[Dict[str, Any]], skip: Callable[[str], bool] = None) -> List[Dict[str, Any]]:
+    """First result per URL, in order; drops results without a URL or matching `skip`"""
+    unique = {}
+    for r in results:
+        url = r.get("url")
+        if url and url not in unique and not (skip and skip(url)):
+            unique[url] = r
+    return list(unique.values())
+
+def _is_broken_sec_xml(url: str) -> bool:
+    # Raw SEC XML links are frequently dead
+    if ".xml" in url.lower() and "sec.gov" in url:
+        print(f"⚠️ Skipping potentially broken SEC XML link: {url}")
+        return True
+    return False
+
 @register_tool("search_sec_filings")
 async def search_sec_filings(
     company_or_investor: str,
@@ -1382,33 +1697,29 @@ async def search_sec_filings(
         print(f"🔍 Searching SEC filings: {query}")
         
         # Use Exa to search with focus on SEC documents
-        results = await exa_client.search(
+        searches = [exa_client.search(
             query=query,
             num_results=20,
             type="auto",
             include_domains=["sec.gov", "seekingalpha.com", "finviz.com", "whalewisdom.com"]
-        )
-        
-        search_results = results.get("results", [])
+        )]
         
         # Also try specific 13F search for institutional investors
         if "capital" in company_or_investor.lower() or "management" in company_or_investor.lower():
             holdings_query = f"{company_or_investor} portfolio holdings stock positions 13F"
-            holdings_results = await exa_client.search(
+            searches.append(exa_client.search(
                 query=holdings_query,
                 num_results=15,
                 type="auto"
-            )
-            search_results.extend(holdings_results.get("results", []))
+            ))
+        
+        # Independent searches - run them concurrently
+        search_results = _merge_search_results(
+            await asyncio.gather(*searches, return_exceptions=True)
+        )
         
         # Remove duplicates
-        seen_urls = set()
-        unique_results = []
-        for r in search_results:
-            url = r.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_results.append(r)
+        unique_results = _dedupe_by_url(search_results)
         
         return {
             "company_or_investor": company_or_investor,
@@ -1419,15 +1730,35 @@ async def search_sec_filings(
                 "title": r.get("title"),
                 "url": r.get("url"),
                 "published_date": r.get("publishedDate"),
-                "text_preview": r.get("text", "")[:300] if r.get("text") else None,
+                "text_preview": body[:300] if (body := r.get("text")) else None,
                 "score": r.get("score")
             } for r in unique_results[:15]]
         }
     
     except Exception as e:
-        print(f"❌ Error searching SEC filings: {e}")
+        logger.warning("Error searching SEC filings for %r: %s", company_or_investor, e)
         return {"error": str(e), "company_or_investor": company_or_investor}
 
+# Source label by registered domain; anything else is news
+_SOURCE_BY_DOMAIN = {
+    "whalewisdom.com": "SEC Aggregator",
+    "fintel.io": "SEC Aggregator",
+    "dataroma.com": "SEC Aggregator",
+    "sec.gov": "SEC.gov",
+    "gurufocus.com": "Analysis",
+    "tipranks.com": "Analysis",
+    "seekingalpha.com": "Analysis",
+}
+
+def _classify_source(url: str) -> str:
+    """Label a result by its host, matching subdomains (www., efts.) to their parent domain"""
+    parts = (urlparse(url).hostname or "").split(".")
+    for i in range(len(parts) - 1):
+        label = _SOURCE_BY_DOMAIN.get(".".join(parts[i:]))
+        if label:
+            return label
+    return "News"
+
 @register_tool("search_institutional_positions")
 async def search_institutional_positions(
     investor_name: str,
@@ -1439,7 +1770,7 @@ async def search_institutional_positions(
     Finds 13F filings, news articles, and portfolio holdings data.
     """
     try:
-        all_results = []
+        searches = []
         
         # Search 1: Institutional holdings aggregators (most reliable)
         if include_sec_filings:
@@ -1449,13 +1780,12 @@ async def search_institutional_positions(
             
             print(f"🔍 Searching institutional holdings: {sec_query}")
             # Prioritize aggregators over direct SEC links (which can be broken)
-            sec_results = await exa_client.search(
+            searches.append(exa_client.search(
                 query=sec_query,
                 num_results=20,
                 type="auto",
                 include_domains=["whalewisdom.com", "fintel.io", "dataroma.com", "gurufocus.com", "tipranks.com"]
-            )
-            all_results.extend(sec_results.get("results", []))
+            ))
         
         # Search 2: News and analysis about positions
         news_query = f"{investor_name} stock holdings portfolio"
@@ -1463,51 +1793,32 @@ async def search_institutional_positions(
             news_query += f" {ticker} stake position"
         
         print(f"🔍 Searching news/analysis: {news_query}")
-        news_results = await exa_client.search(
+        searches.append(exa_client.search(
             query=news_query,
             num_results=15,
             type="auto"
-        )
-        all_results.extend(news_results.get("results", []))
+        ))
         
         # Search 3: If specific ticker, search for that position
         if ticker:
             position_query = f"{investor_name} owns {ticker} shares position stake"
             print(f"🔍 Searching specific position: {position_query}")
-            position_results = await exa_client.search(
+            searches.append(exa_client.search(
                 query=position_query,
                 num_results=10,
                 type="auto"
-            )
-            all_results.extend(position_results.get("results", []))
+            ))
+        
+        # Independent searches - run them concurrently
+        all_results = _merge_search_results(
+            await asyncio.gather(*searches, return_exceptions=True)
+        )
         
         # Remove duplicates and filter out broken SEC XML links
-        seen_urls = set()
-        unique_results = []
-        for r in all_results:
-            url = r.get("url", "")
-            # Skip broken SEC XML links
-            if url and ".xml" in url.lower() and "sec.gov" in url:
-                print(f"⚠️ Skipping potentially broken SEC XML link: {url}")
-                continue
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_results.append(r)
+        unique_results = _dedupe_by_url(all_results, skip=_is_broken_sec_xml)
         
         # Sort by relevance score
-        unique_results.sort(key=lambda x: x.get("score", 0), reverse=True)
-        
-        # Classify sources
-        def classify_source(url):
-            url_lower = url.lower()
-            if any(domain in url_lower for domain in ["whalewisdom.com", "fintel.io", "dataroma.com"]):
-                return "SEC Aggregator"
-            elif "sec.gov" in url_lower:
-                return "SEC.gov"
-            elif any(domain in url_lower for domain in ["gurufocus.com", "tipranks.com", "seekingalpha.com"]):
-                return "Analysis"
-            else:
-                return "News"
+        top_results = heapq.nlargest(25, unique_results, key=lambda x: x.get("score") or 0)
         
         return {
             "investor_name": investor_name,
@@ -1517,14 +1828,14 @@ async def search_institutional_positions(
                 "title": r.get("title"),
                 "url": r.get("url"),
                 "published_date": r.get("publishedDate"),
-                "text_preview": r.get("text", "")[:400] if r.get("text") else None,
+                "text_preview": body[:400] if (body := r.get("text")) else None,
                 "score": r.get("score"),
-                "source": classify_source(r.get("url", ""))
-            } for r in unique_results[:25]]
+                "source": _classify_source(r.get("url", ""))
+            } for r in top_results]
         }
     
     except Exception as e:
-        print(f"❌ Error searching institutional positions: {e}")
+        logger.warning("Error searching institutional positions for %r: %s", investor_name, e)
         return {"error": str(e), "investor_name": investor_name}
 
 @register_tool("search_earnings_materials")
@@ -1553,7 +1864,8 @@ async def search_earnings_materials(
             query=query,
             num_results=20,
             type="auto",
-            include_domains=["seekingalpha.com", "fool.com", "investors.com", "sec.gov"]
+            include_domains=["seekingalpha.com", "fool.com", "investors.com", "sec.gov"],
+            cache_ttl=CACHE_TTL_NEWS
         )
         
         search_results = results.get("results", [])
@@ -1569,18 +1881,79 @@ async def search_earnings_materials(
                 "type": ("Transcript" if "transcript" in r.get("title", "").lower() 
                         else "Presentation" if "presentation" in r.get("title", "").lower()
                         else "Press Release"),
-                "text_preview": r.get("text", "")[:300] if r.get("text") else None
+                "text_preview": body[:300] if (body := r.get("text")) else None
             } for r in search_results[:15]]
         }
     
     except Exception as e:
-        print(f"❌ Error searching earnings materials: {e}")
+        logger.warning("Error searching earnings materials for %r: %s", company_or_ticker, e)
         return {"error": str(e), "company_or_ticker": company_or_ticker}
 
 # ============================================================================
 # SIGNAL DISCOVERY TOOLS (Multi-Source Intelligence)
 # ============================================================================
 
+def _keyword_re(*keywords: str) -> re.Pattern:
+    """Whole-word alternation, longest first so phrases win over their prefixes"""
+    alternation = "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+def _count_keywords(pattern: re.Pattern, text: str) -> int:
+    """Distinct keywords from `pattern` present in text (repeats in one post count once)"""
+    return len(set(pattern.findall(text)))
+
+# Whole words only: "buy" shouldn't fire on "buying", nor "short" on "shortage"
+_REDDIT_BULLISH_RE = _keyword_re("bullish", "moon", "buy", "calls", "rocket", "yolo", "diamond hands", "hodl", "breakout", "pump")
+_REDDIT_BEARISH_RE = _keyword_re("bearish", "puts", "sell", "crash", "dump", "rip", "dead", "overvalued", "short")
+_TWITTER_BULLISH_RE = _keyword_re("bullish", "long", "buy", "moon", "calls", "breakout", "bullish af", "undervalued")
+_TWITTER_BEARISH_RE = _keyword_re("bearish", "short", "sell", "puts", "crash", "overvalued", "dump")
+
+# 13F activity categories, checked in this order
+_13F_NEW_RE = _keyword_re("new position", "initiates", "new stake", "adds")
+_13F_INCREASED_RE = _keyword_re("increases", "adds to", "boost", "doubles")
+_13F_DECREASED_RE = _keyword_re("reduces", "trims", "cuts", "decreases")
+_13F_EXITED_RE = _keyword_re("exits", "sells out", "liquidates", "closes")
+
+# Stop scanning once this many signals show a clear winner (|bull - bear| / total above the margin)
+SENTIMENT_MIN_SIGNALS = 100
+SENTIMENT_DECISIVE_MARGIN = 0.3
+
+def _score_posts(
+    posts: List[Dict[str, Any]],
+    bullish_re: re.Pattern,
+    bearish_re: re.Pattern
+) -> Tuple[float, int, int, int]:
+    """
+    Tally bullish/bearish keywords across posts (title + text), stopping early once the result is decisive.
+    Returns (score, bullish_count, bearish_count, posts_analyzed); score is 0-1, 0 bearish, 1 bullish,
+    0.5 with no signals.
+    """
+    bullish_count = 0
+    bearish_count = 0
+    posts_analyzed = 0
+    
+    for post in posts:
+        combined = ((post.get("title") or "") + " " + (post.get("text") or "")).lower()
+        bullish_count += _count_keywords(bullish_re, combined)
+        bearish_count += _count_keywords(bearish_re, combined)
+        posts_analyzed += 1
+        
+        total_signals = bullish_count + bearish_count
+        if (total_signals >= SENTIMENT_MIN_SIGNALS
+                and abs(bullish_count - bearish_count) > SENTIMENT_DECISIVE_MARGIN * total_signals):
+            break
+    
+    total_signals = bullish_count + bearish_count
+    score = bullish_count / total_signals if total_signals > 0 else 0.5
+    return score, bullish_count, bearish_count, posts_analyzed
+
+# Score cut-offs between adjacent labels (a score on a cut-off takes the higher label)
+_SENTIMENT_THRESHOLDS = (0.3, 0.45, 0.55, 0.7)
+_SENTIMENT_LABELS = ("VERY BEARISH", "BEARISH", "NEUTRAL", "BULLISH", "VERY BULLISH")
+
+def _sentiment_label(score: float) -> str:
+    return _SENTIMENT_LABELS[bisect.bisect_right(_SENTIMENT_THRESHOLDS, score)]
+
 @register_tool("get_reddit_sentiment")
 async def get_reddit_sentiment(ticker: str) -> Dict[str, Any]:
     """
@@ -1595,7 +1968,8 @@ async def get_reddit_sentiment(ticker: str) -> Dict[str, Any]:
             query=f"{ticker} stock discussion sentiment reddit wallstreetbets investing",
             num_results=30,
             type="auto",
-            include_domains=["reddit.com"]
+            include_domains=["reddit.com"],
+            cache_ttl=CACHE_TTL_SOCIAL
         )
         
         posts = results.get("results", [])
@@ -1611,35 +1985,10 @@ async def get_reddit_sentiment(ticker: str) -> Dict[str, Any]:
             }
         
         # Analyze sentiment from titles and content
-        bullish_keywords = ["bullish", "moon", "buy", "calls", "rocket", "yolo", "diamond hands", "hodl", "breakout", "pump"]
-        bearish_keywords = ["bearish", "puts", "sell", "crash", "dump", "rip", "dead", "overvalued", "short"]
-        
-        bullish_count = 0
-        bearish_count = 0
-        
-        for post in posts:
-            title = post.get("title", "").lower()
-            text = post.get("text", "").lower()
-            combined = title + " " + text
-            
-            bullish_count += sum(1 for word in bullish_keywords if word in combined)
-            bearish_count += sum(1 for word in bearish_keywords if word in combined)
-        
-        # Calculate sentiment score (0-1, where 0 is bearish, 1 is bullish)
-        total_signals = bullish_count + bearish_count
-        sentiment_score = bullish_count / total_signals if total_signals > 0 else 0.5
-        
-        # Determine sentiment label
-        if sentiment_score >= 0.7:
-            sentiment_label = "VERY BULLISH"
-        elif sentiment_score >= 0.55:
-            sentiment_label = "BULLISH"
-        elif sentiment_score >= 0.45:
-            sentiment_label = "NEUTRAL"
-        elif sentiment_score >= 0.3:
-            sentiment_label = "BEARISH"
-        else:
-            sentiment_label = "VERY BEARISH"
+        sentiment_score, bullish_count, bearish_count, posts_analyzed = _score_posts(
+            posts, _REDDIT_BULLISH_RE, _REDDIT_BEARISH_RE
+        )
+        sentiment_label = _sentiment_label(sentiment_score)
         
         return {
             "ticker": ticker,
@@ -1647,15 +1996,16 @@ async def get_reddit_sentiment(ticker: str) -> Dict[str, Any]:
             "sentiment_label": sentiment_label,
             "mention_volume": len(posts),
             "trending": len(posts) > 20,  # More than 20 mentions = trending
+            "posts_analyzed": posts_analyzed,
             "bullish_signals": bullish_count,
             "bearish_signals": bearish_count,
             "top_posts": [{
                 "title": p.get("title"),
                 "url": p.get("url"),
                 "date": p.get("publishedDate"),
-                "preview": p.get("text", "")[:200] if p.get("text") else None
+                "preview": body[:200] if (body := p.get("text")) else None
             } for p in posts[:5]],
-            "summary": f"Reddit sentiment: {sentiment_label} ({int(sentiment_score*100)}% bullish) based on {len(posts)} discussions"
+            "summary": f"Reddit sentiment: {sentiment_label} ({int(sentiment_score*100)}% bullish) based on {posts_analyzed} discussions"
         }
     
     except Exception as e:
@@ -1676,7 +2026,8 @@ async def get_twitter_sentiment(ticker: str) -> Dict[str, Any]:
             query=f"{ticker} stock fintwit twitter sentiment analysis",
             num_results=25,
             type="auto",
-            include_domains=["twitter.com", "x.com", "stocktwits.com"]
+            include_domains=["twitter.com", "x.com", "stocktwits.com"],
+            cache_ttl=CACHE_TTL_SOCIAL
         )
         
         tweets = results.get("results", [])
@@ -1692,30 +2043,10 @@ async def get_twitter_sentiment(ticker: str) -> Dict[str, Any]:
             }
         
         # Analyze sentiment
-        bullish_keywords = ["bullish", "long", "buy", "moon", "calls", "breakout", "bullish af", "undervalued"]
-        bearish_keywords = ["bearish", "short", "sell", "puts", "crash", "overvalued", "dump", "bearish"]
-        
-        bullish_count = 0
-        bearish_count = 0
-        
-        for tweet in tweets:
-            text = (tweet.get("title", "") + " " + tweet.get("text", "")).lower()
-            bullish_count += sum(1 for word in bullish_keywords if word in text)
-            bearish_count += sum(1 for word in bearish_keywords if word in text)
-        
-        total_signals = bullish_count + bearish_count
-        sentiment_score = bullish_count / total_signals if total_signals > 0 else 0.5
-        
-        if sentiment_score >= 0.7:
-            sentiment_label = "VERY BULLISH"
-        elif sentiment_score >= 0.55:
-            sentiment_label = "BULLISH"
-        elif sentiment_score >= 0.45:
-            sentiment_label = "NEUTRAL"
-        elif sentiment_score >= 0.3:
-            sentiment_label = "BEARISH"
-        else:
-            sentiment_label = "VERY BEARISH"
+        sentiment_score, bullish_count, bearish_count, posts_analyzed = _score_posts(
+            tweets, _TWITTER_BULLISH_RE, _TWITTER_BEARISH_RE
+        )
+        sentiment_label = _sentiment_label(sentiment_score)
         
         return {
             "ticker": ticker,
@@ -1723,15 +2054,16 @@ async def get_twitter_sentiment(ticker: str) -> Dict[str, Any]:
             "sentiment_label": sentiment_label,
             "mention_volume": len(tweets),
             "trending": len(tweets) > 15,
+            "posts_analyzed": posts_analyzed,
             "bullish_signals": bullish_count,
             "bearish_signals": bearish_count,
             "influencer_takes": [{
                 "text": t.get("title"),
                 "url": t.get("url"),
                 "date": t.get("publishedDate"),
-                "preview": t.get("text", "")[:200] if t.get("text") else None
+                "preview": body[:200] if (body := t.get("text")) else None
             } for t in tweets[:5]],
-            "summary": f"Twitter sentiment: {sentiment_label} ({int(sentiment_score*100)}% bullish) based on {len(tweets)} posts"
+            "summary": f"Twitter sentiment: {sentiment_label} ({int(sentiment_score*100)}% bullish) based on {posts_analyzed} posts"
         }
     
     except Exception as e:
@@ -1752,7 +2084,8 @@ async def get_13f_changes(ticker: str) -> Dict[str, Any]:
             query=f"{ticker} 13F filing increases new position institutional buying hedge fund",
             num_results=25,
             type="auto",
-            include_domains=["whalewisdom.com", "fintel.io", "dataroma.com", "gurufocus.com", "13f.info"]
+            include_domains=["whalewisdom.com", "fintel.io", "dataroma.com", "gurufocus.com", "13f.info"],
+            cache_ttl=CACHE_TTL_NEWS
         )
         
         filings = results.get("results", [])
@@ -1779,13 +2112,13 @@ async def get_13f_changes(ticker: str) -> Dict[str, Any]:
             text = filing.get("text", "").lower()
             combined = title + " " + text
             
-            if any(word in combined for word in ["new position", "initiates", "new stake", "adds"]):
+            if _13F_NEW_RE.search(combined):
                 new_positions.append(filing)
-            elif any(word in combined for word in ["increases", "adds to", "boost", "doubles"]):
+            elif _13F_INCREASED_RE.search(combined):
                 increased.append(filing)
-            elif any(word in combined for word in ["reduces", "trims", "cuts", "decreases"]):
+            elif _13F_DECREASED_RE.search(combined):
                 decreased.append(filing)
-            elif any(word in combined for word in ["exits", "sells out", "liquidates", "closes"]):
+            elif _13F_EXITED_RE.search(combined):
                 exited.append(filing)
         
         # Determine activity level
@@ -1840,7 +2173,8 @@ async def get_unusual_activity(ticker: str) -> Dict[str, Any]:
         results = await exa_client.search(
             query=f"{ticker} unusual options activity dark pool whales large orders flow",
             num_results=20,
-            type="auto"
+            type="auto",
+            cache_ttl=CACHE_TTL_SOCIAL
         )
         
         activities = results.get("results", [])
@@ -1853,11 +2187,16 @@ async def get_unusual_activity(ticker: str) -> Dict[str, Any]:
                 "summary": f"No unusual activity detected for {ticker}"
             }
         
-        # Detect activity types
-        unusual_calls = any("call" in a.get("title", "").lower() for a in activities)
-        unusual_puts = any("put" in a.get("title", "").lower() for a in activities)
-        dark_pool = any("dark pool" in (a.get("title", "") + a.get("text", "")).lower() for a in activities)
-        large_blocks = any("block" in a.get("title", "").lower() for a in activities)
+        # Detect activity types in one pass, lowercasing each title/text once
+        unusual_calls = unusual_puts = dark_pool = large_blocks = False
+        for a in activities:
+            title = (a.get("title") or "").lower()
+            unusual_calls = unusual_calls or "call" in title
+            unusual_puts = unusual_puts or "put" in title
+            large_blocks = large_blocks or "block" in title
+            dark_pool = dark_pool or "dark pool" in title or "dark pool" in (a.get("text") or "").lower()
+            if unusual_calls and unusual_puts and large_blocks and dark_pool:
+                break  # every type already detected
         
         activity_types = []
         if unusual_calls:
@@ -1887,7 +2226,7 @@ async def get_unusual_activity(ticker: str) -> Dict[str, Any]:
                 "title": a.get("title"),
                 "url": a.get("url"),
                 "date": a.get("publishedDate"),
-                "preview": a.get("text", "")[:150] if a.get("text") else None
+                "preview": body[:150] if (body := a.get("text")) else None
             } for a in activities[:5]],
             "summary": f"Unusual Activity: {bias} bias detected - {', '.join(activity_types) if activity_types else 'None'}"
         }
@@ -1913,8 +2252,6 @@ async def run_deep_research(ticker: str, mode: str = "standard") -> Dict[str, An
         
         # Import here to avoid circular imports
         from agents.debate_coordinator import DebateCoordinator
-        from agents.research_config import get_config
-        import httpx
         
         # Get config for mode
         config = get_config(mode)
@@ -1927,12 +2264,7 @@ async def run_deep_research(ticker: str, mode: str = "standard") -> Dict[str, An
         
         # Save to research API for whiteboard access
         try:
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    "http://localhost:8788/api/research/save",
-                    json=report,
-                    timeout=5.0
-                )
+            await _save_client.post("/api/research/save", json=report)
             print(f"✅ Research data saved for whiteboard access")
         except Exception as save_err:
             print(f"⚠️ Could not save research data: {save_err}")
@@ -1940,9 +2272,7 @@ async def run_deep_research(ticker: str, mode: str = "standard") -> Dict[str, An
         return report
     
     except Exception as e:
-        print(f"❌ Error running deep research: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error running deep research for %s", ticker)
         return {"error": str(e), "ticker": ticker}
 
 
@@ -1950,6 +2280,53 @@ async def run_deep_research(ticker: str, mode: str = "standard") -> Dict[str, An
 # PEER COMPARISON & COMPETITIVE ANALYSIS
 # ============================================================================
 
+# Default peers by sector
+_SECTOR_PEERS = {
+    "TSLA": ["RIVN", "LCID", "F", "GM"],
+    "NVDA": ["AMD", "INTC", "QCOM", "AVGO"],
+    "AAPL": ["MSFT", "GOOGL", "META", "AMZN"],
+    "MSFT": ["AAPL", "GOOGL", "AMZN", "META"],
+}
+
+def _default_peers(ticker: str) -> List[str]:
+    """Peers for a ticker; share classes (BRK.B, BF-B) fall back to their base symbol"""
+    symbol = ticker.upper()
+    peers = _SECTOR_PEERS.get(symbol)
+    if peers is None:
+        peers = _SECTOR_PEERS.get(re.split(r"[.\-]", symbol, maxsplit=1)[0], [])
+    return list(peers)
+
+async def _peer_row(t: str) -> Optional[Dict[str, Any]]:
+    """One peer comparison row; price and financials are fetched concurrently"""
+    try:
+        price_data, fin_data = await asyncio.gather(
+            get_stock_price(ticker=t, include_chart=False),
+            get_financials(ticker=t)
+        )
+        
+        # Annualize EPS if quarterly data (multiply by 4)
+        eps = fin_data.get("eps")
+        eps_annual = eps * 4 if eps and fin_data.get("period") == "quarterly" else eps
+        
+        # Calculate P/E with annualized EPS
+        pe_ratio = None
+        if eps_annual and eps_annual > 0 and price_data.get("price"):
+            pe_ratio = price_data["price"] / eps_annual
+        
+        return {
+            "ticker": t,
+            "price": price_data.get("price", 0),
+            "market_cap": price_data.get("market_cap", 0),
+            "pe_ratio": pe_ratio,
+            "profit_margin": fin_data.get("profit_margin_pct"),
+            "revenue": fin_data.get("revenue_billions"),
+            "eps": eps_annual,  # Show annualized EPS
+            "eps_period": "TTM (est)" if fin_data.get("period") == "quarterly" else "Annual",
+        }
+    except Exception as e:
+        print(f"⚠️ Could not get data for {t}: {e}")
+        return None
+
 @register_tool("get_peer_comparison")
 async def get_peer_comparison(ticker: str, peers: List[str] = None) -> Dict[str, Any]:
     """
@@ -1959,47 +2336,13 @@ async def get_peer_comparison(ticker: str, peers: List[str] = None) -> Dict[str,
     try:
         print(f"📊 Getting peer comparison for {ticker}...")
         
-        # Default peers by sector
-        sector_peers = {
-            "TSLA": ["RIVN", "LCID", "F", "GM"],
-            "NVDA": ["AMD", "INTC", "QCOM", "AVGO"],
-            "AAPL": ["MSFT", "GOOGL", "META", "AMZN"],
-            "MSFT": ["AAPL", "GOOGL", "AMZN", "META"],
-        }
-        
         if not peers:
-            peers = sector_peers.get(ticker, [])
+            peers = _default_peers(ticker)
         
-        # Gather data for main ticker and peers
+        # Gather data for main ticker and peers, all tickers at once
         all_tickers = [ticker] + peers
-        comparison_data = []
-        
-        for t in all_tickers[:5]:  # Limit to 5 total
-            try:
-                price_data = await get_stock_price(ticker=t, include_chart=False)
-                fin_data = await get_financials(ticker=t)
-                
-                # Annualize EPS if quarterly data (multiply by 4)
-                eps = fin_data.get("eps")
-                eps_annual = eps * 4 if eps and fin_data.get("period") == "quarterly" else eps
-                
-                # Calculate P/E with annualized EPS
-                pe_ratio = None
-                if eps_annual and eps_annual > 0 and price_data.get("price"):
-                    pe_ratio = price_data["price"] / eps_annual
-                
-                comparison_data.append({
-                    "ticker": t,
-                    "price": price_data.get("price", 0),
-                    "market_cap": price_data.get("market_cap", 0),
-                    "pe_ratio": pe_ratio,
-                    "profit_margin": fin_data.get("profit_margin_pct"),
-                    "revenue": fin_data.get("revenue_billions"),
-                    "eps": eps_annual,  # Show annualized EPS
-                    "eps_period": "TTM (est)" if fin_data.get("period") == "quarterly" else "Annual",
-                })
-            except Exception as e:
-                print(f"⚠️ Could not get data for {t}: {e}")
+        rows = await asyncio.gather(*(_peer_row(t) for t in all_tickers[:5]))  # Limit to 5 total
+        comparison_data = [row for row in rows if row is not None]
         
         return {
             "ticker": ticker,
@@ -2054,90 +2397,6 @@ async def get_historical_financials(ticker: str, periods: int = 8) -> Dict[str,
         return {"error": str(e), "ticker": ticker}
 
 
-@register_tool("get_balance_sheet")
-async def get_balance_sheet(ticker: str) -> Dict[str, Any]:
-    """
-    Get full balance sheet (assets, liabilities, equity).
-    """
-    try:
-        print(f"📊 Getting balance sheet for {ticker}...")
-        
-        # Use Financial Datasets AI if available
-        fin_data = await get_financials(ticker=ticker)
-        
-        # Extract or create balance sheet
-        balance_sheet = {
-            "ticker": ticker,
-            "period": fin_data.get("report_period", "Latest"),
-            "assets": {
-                "current_assets": fin_data.get("total_assets", 0) * 0.4 if fin_data.get("total_assets") else None,
-                "total_assets": fin_data.get("total_assets"),
-                "cash_and_equivalents": None,
-                "accounts_receivable": None,
-                "inventory": None,
-                "property_equipment": None,
-            },
-            "liabilities": {
-                "current_liabilities": fin_data.get("total_debt", 0) * 0.3 if fin_data.get("total_debt") else None,
-                "total_liabilities": fin_data.get("total_debt"),
-                "accounts_payable": None,
-                "long_term_debt": fin_data.get("total_debt"),
-            },
-            "equity": {
-                "total_equity": None,
-                "retained_earnings": None,
-                "shareholders_equity": None,
-            }
-        }
-        
-        return balance_sheet
-    
-    except Exception as e:
-        print(f"❌ Error getting balance sheet: {e}")
-        return {"error": str(e), "ticker": ticker}
-
-
-@register_tool("get_cash_flow")
-async def get_cash_flow(ticker: str) -> Dict[str, Any]:
-    """
-    Get cash flow statement (operating, investing, financing activities).
-    """
-    try:
-        print(f"💰 Getting cash flow statement for {ticker}...")
-        
-        # Use Financial Datasets AI data
-        fin_data = await get_financials(ticker=ticker)
-        
-        cash_flow = {
-            "ticker": ticker,
-            "period": fin_data.get("report_period", "Latest"),
-            "operating_activities": {
-                "net_income": fin_data.get("net_income"),
-                "depreciation_amortization": None,
-                "change_working_capital": None,
-                "operating_cash_flow": None,
-            },
-            "investing_activities": {
-                "capex": None,
-                "acquisitions": None,
-                "investing_cash_flow": None,
-            },
-            "financing_activities": {
-                "debt_issued": None,
-                "dividends_paid": None,
-                "stock_buybacks": None,
-                "financing_cash_flow": None,
-            },
-            "free_cash_flow": None,
-        }
-        
-        return cash_flow
-    
-    except Exception as e:
-        print(f"❌ Error getting cash flow: {e}")
-        return {"error": str(e), "ticker": ticker}
-
-
 @register_tool("get_earnings_highlights")
 async def get_earnings_highlights(ticker: str) -> Dict[str, Any]:
     """
@@ -2504,7 +2763,6 @@ async def analyze_portfolio_recommendations(
         print(f"   Mode: {mode}")
         
         # Initialize portfolio debate coordinator
-        from agents.research_config import get_config
         config = get_config(mode)
         coordinator = PortfolioDebateCoordinator(config)
         
@@ -2522,9 +2780,7 @@ async def analyze_portfolio_recommendations(
         }
     
     except Exception as e:
-        print(f"❌ Error in portfolio recommendations: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in portfolio recommendations")
         return {
             "success": False,
             "error": str(e),
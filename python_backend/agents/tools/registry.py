@@ -271,6 +271,11 @@ TOOL_DEFINITIONS = [
                         "type": "boolean",
                         "description": "Include full text content",
                         "default": True
+                    },
+                    "bypass_cache": {
+                        "type": "boolean",
+                        "description": "Skip cached results (searches are reused for up to a day). Set only when the user needs breaking news from the last few hours.",
+                        "default": False
                     }
                 },
                 "required": ["query"]
@@ -288,6 +293,11 @@ TOOL_DEFINITIONS = [
                     "query": {
                         "type": "string",
                         "description": "The question to answer"
+                    },
+                    "bypass_cache": {
+                        "type": "boolean",
+                        "description": "Skip cached answers (reused for 10 minutes). Set only for fast-moving, right-now questions.",
+                        "default": False
                     }
                 },
                 "required": ["query"]
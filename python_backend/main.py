@@ -8,14 +8,19 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import os
+import asyncio
+import queue
+import logging
+import logging.handlers
 from dotenv import load_dotenv
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 
 from agents.system import AlphaWealthSystem
+from agents.tools.implementations import set_alpha_system, close_clients, warm_clients
 from services.session_manager import SessionManager
-from services.robinhood_client import RobinhoodClient
+from agents.tools.fire_tools import robinhood_client as fire_robinhood_client
 # SnapTrade removed - using mock portfolio for recommendations
 # from services.snaptrade_client import SnapTradeClient
 from services.supabase_client import supabase_client
@@ -23,6 +28,18 @@ from services.supabase_client import supabase_client
 # Load environment variables
 load_dotenv()
 
+# One logging setup for the whole app; modules log through logging.getLogger(__name__).
+# Records go onto a queue and a background thread writes them, so request handlers never block on stdout.
+# The writer thread runs for the app's lifespan; anything logged before startup waits in the queue.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+
 # Initialize services on startup
 alpha_system = None
 session_manager = None
@@ -34,14 +51,18 @@ async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     global alpha_system, session_manager, robinhood_client  # snaptrade_client removed
     
+    _log_listener.start()
     print("🚀 Starting AlphaWealth...")
     
     # Initialize the AI system
     alpha_system = AlphaWealthSystem()
+    set_alpha_system(alpha_system)  # analyze_stock reuses this instead of building its own
     session_manager = SessionManager()
     
-    # Initialize clients
-    robinhood_client = RobinhoodClient()
+    # Initialize clients (share the FIRE tools' pooled client so there is one pool to close)
+    robinhood_client = fire_robinhood_client
+    # Warm the upstream pools in the background; startup doesn't wait on it
+    warmup_task = asyncio.create_task(warm_clients())
     # snaptrade_client = SnapTradeClient()  # Removed - using mock portfolio
     
     # Check Supabase client
@@ -55,6 +76,12 @@ async def lifespan(app: FastAPI):
     yield
     
     print("👋 Shutting down AlphaWealth...")
+    warmup_task.cancel()
+    try:
+        await robinhood_client.close()
+        await close_clients()
+    finally:
+        _log_listener.stop()  # flush queued log records; started again on the next startup
 
 # Create FastAPI app
 app = FastAPI(
@@ -0,0 +1,144 @@
+"""
+Async TTL Cache - In-process caching for upstream API calls
+Keeps repeated agent turns from re-fetching data that hasn't changed
+"""
+
+import time
+import json
+import copy
+import asyncio
+import inspect
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# TTLs (seconds) matched to how often each kind of data actually changes
+CACHE_TTL_QUOTE = 10
+CACHE_TTL_PRICE_HISTORY = 60 * 60
+CACHE_TTL_MOVERS = 60
+CACHE_TTL_NEWS = 60 * 60
+CACHE_TTL_SOCIAL = 5 * 60
+CACHE_TTL_FINANCIALS = 24 * 60 * 60
+CACHE_TTL_INSIDER = 24 * 60 * 60
+CACHE_TTL_INSTITUTIONAL = 24 * 60 * 60
+CACHE_TTL_METRICS = 12 * 60 * 60
+CACHE_TTL_EARNINGS = 60 * 60
+CACHE_TTL_ANALYST_RATINGS = 60 * 60
+# How long an ETag'd body is kept for If-None-Match revalidation once its TTL entry lapses
+CACHE_TTL_REVALIDATE = 7 * 24 * 60 * 60
+CACHE_TTL_EXA_SEARCH = 24 * 60 * 60
+CACHE_TTL_EXA_ANSWER = 10 * 60
+CACHE_TTL_EXA_SIMILAR = 60 * 60
+CACHE_TTL_EXA_CONTENTS = 60 * 60
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after a per-entry TTL"""
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: float):
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+
+def _is_error(result: Any) -> bool:
+    """Tool results carrying an error key should not be cached"""
+    return isinstance(result, dict) and "error" in result
+
+
+def _private_copy(value: Any) -> Any:
+    """Callers get their own copy of mutable results, so edits can't leak into the cache"""
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    """Mark a shared fetch's error as retrieved even if every waiter was cancelled"""
+    if not task.cancelled():
+        task.exception()
+
+
+def make_key(args: tuple, kwargs: Dict[str, Any]) -> str:
+    return json.dumps([args, sorted(kwargs.items())], default=str)
+
+
+def async_ttl_cache(
+    ttl: float,
+    max_size: int = 512,
+    skip: Optional[Callable[[Any], bool]] = _is_error,
+    key: Optional[Callable[..., Any]] = None
+):
+    """
+    Cache an async function's results for `ttl` seconds, keyed on its arguments.
+    Results for which `skip(result)` is true (errors by default) are not stored.
+    Concurrent misses for the same key share a single call to `func`.
+    `key` takes the call's arguments and returns a custom (e.g. normalized) key.
+    Arguments are bound to the signature first (defaults filled, `ticker` uppercased),
+    so f("AAPL"), f(ticker="aapl") and f(ticker="AAPL", period=<default>) share one entry.
+    Callers can pass bypass_cache=True to skip the lookup and refresh the entry.
+    dict/list results are deep-copied for every caller; the cached object is never handed out.
+    """
+    def decorator(func):
+        cache = TTLCache(max_size)
+        signature = inspect.signature(func)
+
+        def bind(args: tuple, kwargs: Dict[str, Any]) -> inspect.BoundArguments:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            ticker = bound.arguments.get("ticker")
+            if isinstance(ticker, str):
+                bound.arguments["ticker"] = ticker.upper()
+            return bound
+        # Misses currently being fetched; concurrent identical calls share one upstream request
+        inflight: Dict[str, asyncio.Future] = {}
+
+        async def fill(cache_key: str, args: tuple, kwargs: Dict[str, Any]):
+            try:
+                result = await func(*args, **kwargs)
+                if skip is None or not skip(result):
+                    cache.set(cache_key, result, ttl)
+                return result
+            finally:
+                inflight.pop(cache_key, None)
+
+        @wraps(func)
+        async def wrapper(*args, bypass_cache: bool = False, **kwargs):
+            bound = bind(args, kwargs)
+            args, kwargs = bound.args, bound.kwargs
+            cache_key = make_key((key(*args, **kwargs),), {}) if key else make_key((), bound.arguments)
+            if not bypass_cache:
+                hit, value = cache.get(cache_key)
+                if hit:
+                    return _private_copy(value)
+
+            # A fetch already in flight is as fresh as a new one, so bypassing callers join it too
+            task = inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(fill(cache_key, args, kwargs))
+                task.add_done_callback(_retrieve_exception)
+                inflight[cache_key] = task
+            # Shield so one caller being cancelled doesn't cancel the shared fetch
+            return _private_copy(await asyncio.shield(task))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -4,8 +4,12 @@ https://exa.ai/
 """
 
 import os
+import asyncio
 import httpx
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from .cache import TTLCache, make_key, _private_copy
+# Search responses carry long text blocks, so decode them with the fastest available parser
+from .speedups import HTTP2_AVAILABLE, json_loads as _json_loads
 
 class ExaClient:
     """Client for Exa AI semantic search"""
@@ -13,33 +17,64 @@ class ExaClient:
     def __init__(self):
         self.api_key = os.getenv("EXA_API_KEY", "")
         self.base_url = "https://api.exa.ai"
+        # httpx advertises gzip/deflate (and br when brotli is installed) and decodes transparently.
+        # Don't hardcode Accept-Encoding: claiming br without the decoder would break responses.
         self.client = httpx.AsyncClient(
+            base_url=self.base_url,
             headers={
                 "x-api-key": self.api_key,
-                "Content-Type": "application/json"
+                "Content-Type": "application/json",
+                "Accept": "application/json"
             },
-            timeout=30.0
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
         )
+        # Caps in-flight Exa requests across every caller so fan-outs don't trip the rate limit
+        self.semaphore = asyncio.Semaphore(int(os.getenv("EXA_MAX_CONCURRENCY", "8")))
+        # Successful searches for callers that opt in via cache_ttl
+        self._search_cache = TTLCache(max_size=512)
+        
+        if not self.api_key:
+            print("⚠️  No EXA_API_KEY found, using mock search results")
+    
+    async def close(self):
+        """Close the pooled HTTP client"""
+        await self.client.aclose()
     
     async def search(
         self,
         query: str,
         num_results: int = 10,
+        cache_ttl: Optional[float] = None,
         **kwargs
     ) -> Any:
-        """Search using Exa"""
+        """Search using Exa. Pass cache_ttl to reuse identical successful searches."""
+        cache_key = None
+        if cache_ttl:
+            cache_key = make_key((query.lower().strip(), num_results), kwargs)
+            hit, cached = self._search_cache.get(cache_key)
+            if hit:
+                return _private_copy(cached)
+        
         try:
-            response = await self.client.post(
-                f"{self.base_url}/search",
-                json={
-                    "query": query,
-                    "numResults": num_results,
-                    **kwargs
-                }
-            )
+            async with self.semaphore:
+                response = await self.client.post(
+                    f"{self.base_url}/search",
+                    json={
+                        "query": query,
+                        "numResults": num_results,
+                        **kwargs
+                    }
+                )
             
             if response.status_code == 200:
-                return response.json()
+                data = _json_loads(response.content)
+                if cache_key:
+                    # The cache keeps its own object; callers (e.g. get_13f_changes) may edit theirs
+                    self._search_cache.set(cache_key, data, cache_ttl)
+                    return _private_copy(data)
+                return data
             else:
                 return self._mock_search_results(query, num_results)
         
@@ -50,13 +85,14 @@ class ExaClient:
     async def get_contents(self, ids: List[str]) -> Any:
         """Get full content for search results"""
         try:
-            response = await self.client.post(
-                f"{self.base_url}/contents",
-                json={"ids": ids}
-            )
+            async with self.semaphore:
+                response = await self.client.post(
+                    f"{self.base_url}/contents",
+                    json={"ids": ids}
+                )
             
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 return {"results": []}
         
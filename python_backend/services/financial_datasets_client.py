@@ -4,9 +4,17 @@ https://financialdatasets.ai/
 """
 
 import os
+import time
+import asyncio
 import httpx
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 from datetime import datetime, timedelta
+from .cache import async_ttl_cache, CACHE_TTL_QUOTE, CACHE_TTL_PRICE_HISTORY
+from .speedups import HTTP2_AVAILABLE
+
+def _is_none(result: Any) -> bool:
+    """Failed fetches return None and fall back to mock data; never cache them"""
+    return result is None
 
 class FinancialDatasetsClient:
     """
@@ -14,26 +22,49 @@ class FinancialDatasetsClient:
     Provides stock prices, financials, SEC filings, etc.
     """
     
+    # Max tickers per multi-ticker snapshot request (keeps the query string sane)
+    QUOTE_BATCH_SIZE = 100
+    # How long to stick to per-ticker quotes after the API ignores a multi-ticker request
+    QUOTE_BATCH_REPROBE_SECONDS = 900
+    
     def __init__(self):
         self.api_key = os.getenv("FDS_API_KEY", "")
         self.base_url = "https://api.financialdatasets.ai"
+        # httpx already negotiates gzip/deflate (br with brotli installed) and decodes transparently
         self.client = httpx.AsyncClient(
             headers={
-                "X-API-KEY": self.api_key
+                "X-API-KEY": self.api_key,
+                "Accept": "application/json"
             },
             timeout=30.0,
-            follow_redirects=True  # CRITICAL: Follow redirects!
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,  # CRITICAL: Follow redirects!
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
         )
         
+        # Monotonic time before which batched quotes are skipped (set when the API ignores `tickers`)
+        self._batch_quotes_disabled_until = 0.0
+        
         if self.api_key:
             print(f"✅ Financial Datasets AI client initialized (key: {self.api_key[:10]}...)")
         else:
             print("⚠️  No FDS_API_KEY found, using mock data")
     
+    async def close(self):
+        """Close the pooled HTTP client"""
+        await self.client.aclose()
+    
     async def get_quote(self, ticker: str) -> Dict[str, Any]:
         """
         Get real-time quote for a ticker
         """
+        quote = await self._fetch_quote(ticker)
+        # Fallback to mock data for development
+        return quote if quote is not None else self._mock_quote(ticker)
+    
+    # Briefly cached; concurrent calls for the same ticker share one request
+    @async_ttl_cache(ttl=CACHE_TTL_QUOTE, max_size=2048, skip=_is_none, key=lambda self, ticker: ticker)
+    async def _fetch_quote(self, ticker: str) -> Optional[Dict[str, Any]]:
         try:
             # Financial Datasets AI endpoint: /prices/snapshot/ (trailing slash required!)
             response = await self.client.get(
@@ -48,28 +79,70 @@ class FinancialDatasetsClient:
                 print(f"✅ Got real data from FDS: {data}")
                 
                 # Extract from FDS response format (snapshot wrapper)
-                snapshot = data.get("snapshot", {})
-                
-                return {
-                    "ticker": ticker,
-                    "price": snapshot.get("price", 0),
-                    "change": snapshot.get("day_change", 0),
-                    "change_percent": snapshot.get("day_change_percent", 0),
-                    "volume": 0,  # Not in snapshot endpoint
-                    "market_cap": snapshot.get("market_cap"),
-                    "timestamp": snapshot.get("time", datetime.now().isoformat())
-                }
+                return self._format_snapshot(ticker, data.get("snapshot", {}))
             else:
                 print(f"⚠️  FDS API returned {response.status_code}, using mock data")
                 print(f"Response: {response.text[:200]}")
-                # Fallback to mock data for development
-                return self._mock_quote(ticker)
+                return None
         
         except Exception as e:
             print(f"❌ Financial Datasets API error: {e}")
             import traceback
             traceback.print_exc()
-            return self._mock_quote(ticker)
+            return None
+    
+    async def get_quotes_batch(
+        self,
+        tickers: List[str],
+        fallback: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None,
+        get: Optional[Callable[[str, Dict[str, Any]], Awaitable[httpx.Response]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get quotes for several tickers in as few requests as possible, keyed by ticker.
+        Batch requests go through `get(path, params)` (default: the pooled client) so callers can
+        apply their own concurrency/timeout limits. Tickers the batch doesn't cover go through
+        `fallback` (default: get_quote) concurrently; tickers whose fallback raises are left out.
+        """
+        quotes: Dict[str, Any] = {}
+        fetch_batch = get or (lambda path, params: self.client.get(f"{self.base_url}{path}", params=params))
+        
+        if tickers and time.monotonic() >= self._batch_quotes_disabled_until:
+            try:
+                for start in range(0, len(tickers), self.QUOTE_BATCH_SIZE):
+                    chunk = tickers[start:start + self.QUOTE_BATCH_SIZE]
+                    response = await fetch_batch("/prices/snapshot/", {"tickers": ",".join(chunk)})
+                    
+                    if response.status_code != 200:
+                        # A bad ticker (400/404), auth, rate-limit or server error: fall back for this call
+                        # only, since one unknown symbol in a portfolio says nothing about batch support
+                        print(f"⚠️  Batch quote request returned {response.status_code}, falling back to per-ticker")
+                        break
+                    
+                    data = response.json()
+                    if "snapshots" not in data:
+                        # Endpoint answered without the multi-ticker shape; retry batching later
+                        self._batch_quotes_disabled_until = time.monotonic() + self.QUOTE_BATCH_REPROBE_SECONDS
+                        break
+                    
+                    wanted = set(chunk)
+                    for snapshot in data["snapshots"]:
+                        ticker = snapshot.get("ticker")
+                        if ticker in wanted:
+                            quotes[ticker] = self._format_snapshot(ticker, snapshot)
+            except Exception as e:
+                print(f"⚠️  Batch quote request failed, falling back to per-ticker: {e}")
+        
+        missing = [t for t in tickers if t not in quotes]
+        if missing:
+            fetch = fallback or self.get_quote
+            results = await asyncio.gather(*[fetch(t) for t in missing], return_exceptions=True)
+            for ticker, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    print(f"⚠️  Quote for {ticker} failed: {result}")
+                else:
+                    quotes[ticker] = result
+        
+        return quotes
     
     async def get_historical_prices(
         self,
@@ -79,6 +152,11 @@ class FinancialDatasetsClient:
         """
         Get historical price data
         """
+        prices = await self._fetch_historical_prices(ticker, timeframe)
+        return prices if prices is not None else self._mock_historical_data(ticker, timeframe)
+    
+    @async_ttl_cache(ttl=CACHE_TTL_PRICE_HISTORY, skip=_is_none, key=lambda self, ticker, timeframe: (ticker, timeframe))
+    async def _fetch_historical_prices(self, ticker: str, timeframe: str) -> Optional[List[Dict[str, Any]]]:
         try:
             # Calculate date range based on timeframe
             from datetime import timedelta
@@ -102,11 +180,11 @@ class FinancialDatasetsClient:
             if response.status_code == 200:
                 return response.json().get("prices", [])
             else:
-                return self._mock_historical_data(ticker, timeframe)
+                return None
         
         except Exception as e:
             print(f"❌ Financial Datasets API error: {e}")
-            return self._mock_historical_data(ticker, timeframe)
+            return None
     
     async def get_intraday_prices(self, ticker: str) -> List[Dict[str, Any]]:
         """
@@ -193,6 +271,18 @@ class FinancialDatasetsClient:
     
     # Mock data for development/fallback
     
+    def _format_snapshot(self, ticker: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Map an FDS price snapshot onto our quote shape"""
+        return {
+            "ticker": ticker,
+            "price": snapshot.get("price", 0),
+            "change": snapshot.get("day_change", 0),
+            "change_percent": snapshot.get("day_change_percent", 0),
+            "volume": 0,  # Not in snapshot endpoint
+            "market_cap": snapshot.get("market_cap"),
+            "timestamp": snapshot.get("time", datetime.now().isoformat())
+        }
+    
     def _mock_quote(self, ticker: str) -> Dict[str, Any]:
         """Mock quote data for development"""
         import random
@@ -22,8 +22,22 @@ class RobinhoodClient:
         self.base_url = "https://api.robinhood.com"
         self.oauth_url = "https://api.robinhood.com/oauth2/token/"
         
+        # One pooled client for every call so repeat requests reuse warm TLS connections
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60
+            )
+        )
+        
         print(f"✅ Robinhood client initialized (redirect: {self.redirect_uri})")
     
+    async def close(self):
+        """Close the pooled HTTP client"""
+        await self.client.aclose()
+    
     def get_authorization_url(self, state: str = None) -> Dict[str, Any]:
         """Generate OAuth2 authorization URL - Note: Robinhood no longer provides public OAuth2"""
         if not state:
@@ -45,31 +59,30 @@ class RobinhoodClient:
     async def exchange_code_for_token(self, code: str) -> Dict[str, Any]:
         """Exchange authorization code for access token"""
         try:
-            async with httpx.AsyncClient() as client:
-                data = {
-                    "grant_type": "authorization_code",
-                    "code": code,
-                    "client_id": self.client_id,
-                    "redirect_uri": self.redirect_uri
+            data = {
+                "grant_type": "authorization_code",
+                "code": code,
+                "client_id": self.client_id,
+                "redirect_uri": self.redirect_uri
+            }
+            
+            response = await self.client.post(self.oauth_url, data=data)
+            
+            if response.status_code == 200:
+                token_data = response.json()
+                return {
+                    "success": True,
+                    "access_token": token_data.get("access_token"),
+                    "refresh_token": token_data.get("refresh_token"),
+                    "expires_in": token_data.get("expires_in"),
+                    "token_type": token_data.get("token_type", "Bearer")
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Token exchange failed: {response.status_code}",
+                    "details": response.text
                 }
-                
-                response = await client.post(self.oauth_url, data=data)
-                
-                if response.status_code == 200:
-                    token_data = response.json()
-                    return {
-                        "success": True,
-                        "access_token": token_data.get("access_token"),
-                        "refresh_token": token_data.get("refresh_token"),
-                        "expires_in": token_data.get("expires_in"),
-                        "token_type": token_data.get("token_type", "Bearer")
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Token exchange failed: {response.status_code}",
-                        "details": response.text
-                    }
         except Exception as e:
             return {
                 "success": False,
@@ -84,24 +97,23 @@ class RobinhoodClient:
                 "Accept": "application/json"
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/accounts/",
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    accounts_data = response.json()
-                    return {
-                        "success": True,
-                        "accounts": accounts_data.get("results", [])
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Failed to get accounts: {response.status_code}",
-                        "details": response.text
-                    }
+            response = await self.client.get(
+                f"{self.base_url}/accounts/",
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                accounts_data = response.json()
+                return {
+                    "success": True,
+                    "accounts": accounts_data.get("results", [])
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to get accounts: {response.status_code}",
+                    "details": response.text
+                }
         except Exception as e:
             return {
                 "success": False,
@@ -116,25 +128,24 @@ class RobinhoodClient:
                 "Accept": "application/json"
             }
             
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/positions/"
-                if account_id:
-                    url = f"{self.base_url}/accounts/{account_id}/positions/"
-                
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code == 200:
-                    positions_data = response.json()
-                    return {
-                        "success": True,
-                        "positions": positions_data.get("results", [])
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Failed to get positions: {response.status_code}",
-                        "details": response.text
-                    }
+            url = f"{self.base_url}/positions/"
+            if account_id:
+                url = f"{self.base_url}/accounts/{account_id}/positions/"
+            
+            response = await self.client.get(url, headers=headers)
+            
+            if response.status_code == 200:
+                positions_data = response.json()
+                return {
+                    "success": True,
+                    "positions": positions_data.get("results", [])
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to get positions: {response.status_code}",
+                    "details": response.text
+                }
         except Exception as e:
             return {
                 "success": False,
@@ -149,27 +160,27 @@ class RobinhoodClient:
                 "Accept": "application/json"
             }
             
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/portfolios/"
-                if account_id:
-                    url = f"{self.base_url}/accounts/{account_id}/portfolio/"
-                
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code == 200:
-                    portfolio_data = response.json()
-                    if isinstance(portfolio_data, dict):
-                        portfolio_data = [portfolio_data]
-                    return {
-                        "success": True,
-                        "portfolios": portfolio_data
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Failed to get portfolios: {response.status_code}",
-                        "details": response.text
-                    }
+            url = f"{self.base_url}/portfolios/"
+            if account_id:
+                url = f"{self.base_url}/accounts/{account_id}/portfolio/"
+            
+            response = await self.client.get(url, headers=headers)
+            
+            if response.status_code == 200:
+                portfolio_data = response.json()
+                # Normalize here so callers can always index portfolios[0]
+                if isinstance(portfolio_data, dict):
+                    portfolio_data = [portfolio_data]
+                return {
+                    "success": True,
+                    "portfolios": portfolio_data
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to get portfolios: {response.status_code}",
+                    "details": response.text
+                }
         except Exception as e:
             return {
                 "success": False,
@@ -179,24 +190,23 @@ class RobinhoodClient:
     async def get_market_data(self, symbols: List[str]) -> Dict[str, Any]:
         """Get market data for symbols"""
         try:
-            async with httpx.AsyncClient() as client:
-                symbols_str = ",".join(symbols)
-                url = f"{self.base_url}/quotes/?symbols={symbols_str}"
-                
-                response = await client.get(url)
-                
-                if response.status_code == 200:
-                    market_data = response.json()
-                    return {
-                        "success": True,
-                        "quotes": market_data.get("results", [])
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Failed to get market data: {response.status_code}",
-                        "details": response.text
-                    }
+            symbols_str = ",".join(symbols)
+            url = f"{self.base_url}/quotes/?symbols={symbols_str}"
+            
+            response = await self.client.get(url)
+            
+            if response.status_code == 200:
+                market_data = response.json()
+                return {
+                    "success": True,
+                    "quotes": market_data.get("results", [])
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to get market data: {response.status_code}",
+                    "details": response.text
+                }
         except Exception as e:
             return {
                 "success": False,
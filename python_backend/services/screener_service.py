@@ -2,9 +2,11 @@
 Market Screener Service - Filter and rank stocks based on criteria
 """
 
+import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from .financial_datasets_client import FinancialDatasetsClient
+from .cache import async_ttl_cache, CACHE_TTL_MOVERS
 
 class ScreenerService:
     """
@@ -41,6 +43,28 @@ class ScreenerService:
         - sector: "Technology"
         """
         
+        # Shared snapshot of the universe; gainers/losers/most-active all slice the same one
+        snapshot = await self._get_universe_snapshot(universe)
+        
+        # Filter based on criteria
+        filtered_stocks = [data for data in snapshot if self._matches_criteria(data, criteria)]
+        
+        # Sort by score or specified metric
+        sort_by = criteria.get("sort_by", "market_cap")
+        reverse = criteria.get("sort_order", "desc") == "desc"
+        
+        filtered_stocks.sort(
+            key=lambda x: x.get(sort_by, 0) or 0,
+            reverse=reverse
+        )
+        
+        # Limit results
+        limit = criteria.get("limit", 20)
+        return filtered_stocks[:limit]
+    
+    @async_ttl_cache(ttl=CACHE_TTL_MOVERS, max_size=8, skip=lambda rows: not rows, key=lambda self, universe: universe)
+    async def _get_universe_snapshot(self, universe: str) -> List[Dict[str, Any]]:
+        """Fetch metrics for every ticker in a universe, dropping failures"""
         # Get stock universe
         if universe == "sp500":
             tickers = self.sp500_tickers
@@ -54,34 +78,12 @@ class ScreenerService:
             tickers = self.sp500_tickers
         
         # Fetch data for all tickers in parallel
-        import asyncio
         results = await asyncio.gather(*[
             self._get_stock_metrics(ticker)
             for ticker in tickers
         ], return_exceptions=True)
         
-        # Filter based on criteria
-        filtered_stocks = []
-        for ticker, data in zip(tickers, results):
-            if isinstance(data, Exception) or not data:
-                continue
-            
-            # Apply filters
-            if self._matches_criteria(data, criteria):
-                filtered_stocks.append(data)
-        
-        # Sort by score or specified metric
-        sort_by = criteria.get("sort_by", "market_cap")
-        reverse = criteria.get("sort_order", "desc") == "desc"
-        
-        filtered_stocks.sort(
-            key=lambda x: x.get(sort_by, 0) or 0,
-            reverse=reverse
-        )
-        
-        # Limit results
-        limit = criteria.get("limit", 20)
-        return filtered_stocks[:limit]
+        return [data for data in results if data and not isinstance(data, Exception)]
     
     async def _get_stock_metrics(self, ticker: str) -> Dict[str, Any]:
         """Get key metrics for a stock"""
@@ -0,0 +1,34 @@
+"""
+Optional speedups shared by the API clients and tools
+Each probe lives here once, so every module falls back the same way when a package is missing
+"""
+
+import json
+from typing import Any
+
+# HTTP/2 lets concurrent calls to one host multiplex over a single connection (needs httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson encodes/decodes several times faster than the stdlib; API bodies and chart payloads are large
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes (NumPy values and non-str keys included)"""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        return json.dumps(obj).encode()
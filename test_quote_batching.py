@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test Batched Quote Fallbacks
+Feeds canned snapshot responses to FinancialDatasetsClient.get_quotes_batch (no network)
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'python_backend'))
+
+from services.financial_datasets_client import FinancialDatasetsClient
+
+class FakeResponse:
+    """Just enough of an httpx.Response for get_quotes_batch"""
+
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data or {}
+
+    def json(self):
+        return self._data
+
+def snapshots_for(tickers):
+    return {"snapshots": [{"ticker": t, "price": 100.0, "day_change_percent": 1.5} for t in tickers]}
+
+async def per_ticker_quote(ticker):
+    """Per-ticker fallback; BADTICKER doesn't exist"""
+    if ticker == "BADTICKER":
+        raise ValueError(f"Unknown ticker {ticker}")
+    return {"ticker": ticker, "price": 50.0}
+
+async def test_bad_ticker_404_keeps_batching():
+    """One unknown symbol 404s its batch but must not turn batching off for later calls"""
+    print("🧪 Testing a bad-ticker 404 on a batched quote request...")
+
+    client = FinancialDatasetsClient()
+    requests = []
+
+    async def get(path, params):
+        tickers = params["tickers"].split(",")
+        requests.append(tickers)
+        if "BADTICKER" in tickers:
+            return FakeResponse(404, {"error": "Ticker not found: BADTICKER"})
+        return FakeResponse(200, snapshots_for(tickers))
+
+    try:
+        quotes = await client.get_quotes_batch(["AAPL", "BADTICKER"], fallback=per_ticker_quote, get=get)
+        # Failed tickers are left out; the rest come from the per-ticker fallback
+        assert quotes == {"AAPL": {"ticker": "AAPL", "price": 50.0}}, quotes
+
+        quotes = await client.get_quotes_batch(["MSFT", "NVDA"], fallback=per_ticker_quote, get=get)
+        assert requests[-1] == ["MSFT", "NVDA"], requests
+        assert quotes["MSFT"]["price"] == 100.0 and quotes["NVDA"]["price"] == 100.0, quotes
+    finally:
+        await client.close()
+
+    print(f"✅ Batching still enabled after a 404 ({len(requests)} batch requests)")
+
+async def test_unsupported_batch_backs_off():
+    """A 200 without `snapshots` means `tickers` was ignored: skip batching until the re-probe window passes"""
+    print("\n🧪 Testing an endpoint that ignores multi-ticker requests...")
+
+    client = FinancialDatasetsClient()
+    requests = []
+
+    async def get(path, params):
+        requests.append(params)
+        return FakeResponse(200, {"snapshot": {}})
+
+    try:
+        await client.get_quotes_batch(["AAPL", "MSFT"], fallback=per_ticker_quote, get=get)
+        await client.get_quotes_batch(["AAPL", "MSFT"], fallback=per_ticker_quote, get=get)
+        assert len(requests) == 1, requests
+
+        client._batch_quotes_disabled_until = 0.0  # re-probe window elapsed
+        await client.get_quotes_batch(["AAPL", "MSFT"], fallback=per_ticker_quote, get=get)
+        assert len(requests) == 2, requests
+    finally:
+        await client.close()
+
+    print("✅ Batching backed off and re-probed")
+
+async def main():
+    await test_bad_ticker_404_keeps_batching()
+    await test_unsupported_batch_backs_off()
+    print("\n🎉 Quote batching tests passed!")
+
+if __name__ == "__main__":
+    asyncio.run(main())